@@ -21,15 +21,49 @@
 
 from time import localtime, strftime, gmtime
 from Plugins.SystemPlugins.ComponentsCockpit.__init__ import _
+from Plugins.SystemPlugins.ComponentsCockpit.TimeUtils import formatDate
 from Components.Converter.ClockToText import ClockToText
 from Components.Element import cached
 from Components.config import config
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+# rendered clock texts of all converters, keyed by (type, format, language, time bucket)
+clock_cache = {}
+CLOCK_CACHE_SIZE = 256
+SECONDS_DIRECTIVES = ("%S", "%s", "%T", "%X", "%c", "%r")
+osd_language = None
+
+
+def setOsdLanguage(configelement):
+	global osd_language
+	osd_language = configelement.value
+
+
+config.osd.language.addNotifier(setOsdLanguage)
+
+
+@profiled
 class COCClockToText(ClockToText):
 
 	def __init__(self, atype):
 		ClockToText.__init__(self, atype)
+		self.fmt = ""
+		self.fmt_prefix = ""
+		self.fmt_time = ""
+		self.resolution = 60
+		if self.type == self.FORMAT:
+			self.fmt = self.fmt_string
+			spos = self.fmt_string.find("%")
+			if spos > -1:
+				self.fmt_prefix = self.fmt_string[:spos]
+				self.fmt_time = self.fmt_string[spos:]
+			else:
+				self.fmt_prefix = self.fmt_string
+			if any(d in self.fmt_time for d in SECONDS_DIRECTIVES):
+				self.resolution = 1
+		elif self.type == self.WITH_SECONDS:
+			self.resolution = 1
 
 	@cached
 	def getText(self):
@@ -48,29 +82,32 @@ class COCClockToText(ClockToText):
 			elif self.type == self.TIMESTAMP:
 				text = str(time)
 			else:
-				if time > (31 * 24 * 60 * 60):
-					# No Recording should be longer than 1 month
-					t = localtime(time)
-				else:
-					t = gmtime(time)
-
-				if self.type == self.WITH_SECONDS:
-					text = "%2d:%02d:%02d" % (t.tm_hour, t.tm_min, t.tm_sec)
-				elif self.type == self.DEFAULT:
-					text = "%02d:%02d" % (t.tm_hour, t.tm_min)
-				elif self.type == self.DATE:
-					if config.osd.language.value == "de_DE":
-						text = strftime("%A, %d. %B %Y", t)
-					else:
-						text = strftime("%A %B %d, %Y", t)
-				elif self.type == self.FORMAT:
-					spos = self.fmt_string.find("%")
-					if spos > -1:
-						s1 = self.fmt_string[:spos]
-						s2 = strftime(self.fmt_string[spos:], t)
-						text = str(s1 + s2)
-					else:
-						text = strftime(self.fmt_string, t)
+				key = (self.type, self.fmt, osd_language, int(time) // self.resolution)
+				text = clock_cache.get(key)
+				if text is None:
+					if len(clock_cache) >= CLOCK_CACHE_SIZE:
+						clock_cache.clear()
+					text = clock_cache[key] = self.formatTime(time)
 		return text
 
 	text = property(getText)
+
+	def formatTime(self, time):
+		text = ""
+		if time > (31 * 24 * 60 * 60):
+			# No Recording should be longer than 1 month
+			t = localtime(time)
+		else:
+			t = gmtime(time)
+
+		if self.type == self.WITH_SECONDS:
+			text = "%2d:%02d:%02d" % (t.tm_hour, t.tm_min, t.tm_sec)
+		elif self.type == self.DEFAULT:
+			text = "%02d:%02d" % (t.tm_hour, t.tm_min)
+		elif self.type == self.DATE:
+			text = formatDate(t, osd_language)
+		elif self.type == self.FORMAT:
+			text = self.fmt_prefix
+			if self.fmt_time:
+				text = str(text + strftime(self.fmt_time, t))
+		return text
@@ -20,8 +20,10 @@
 
 
 from Components.Converter.ConditionalShowHide import ConditionalShowHide
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+@profiled
 class COCConditionalShowHideLabel(ConditionalShowHide, object):
 	def __init__(self, args):
 		ConditionalShowHide.__init__(self, args)
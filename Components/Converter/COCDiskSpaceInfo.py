@@ -22,16 +22,25 @@
 from Poll import Poll
 from Components.Element import cached
 from Components.Converter.Converter import Converter
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+@profiled
 class COCDiskSpaceInfo(Poll, Converter):
 	SPACEINFO = 0
+	WRITE_RATE = 1
+	TIME_LEFT = 2
+	USED = 3
 
 	def __init__(self, atype):
 		Converter.__init__(self, atype)
 		Poll.__init__(self)
 
-		self.type = self.SPACEINFO
+		self.type = {
+			"WriteRate": self.WRITE_RATE,
+			"TimeLeft": self.TIME_LEFT,
+			"Used": self.USED
+		}.get(atype, self.SPACEINFO)
 		self.poll_interval = 2500
 		self.poll_enabled = True
 
@@ -44,6 +53,36 @@ class COCDiskSpaceInfo(Poll, Converter):
 
 	@cached
 	def getText(self):
-		return self.source.space
+		text = ""
+		if self.type == self.SPACEINFO:
+			text = self.source.space
+		elif self.type == self.WRITE_RATE:
+			rate = self.source.write_rate
+			if rate is not None:
+				text = "%.1f MB/s" % (rate / (1024 * 1024))
+		elif self.type == self.TIME_LEFT:
+			hours = self.source.hours_left
+			if hours is not None:
+				text = "%d:%02d h" % divmod(int(hours * 60), 60)
+		elif self.type == self.USED:
+			used = self.source.used_percent
+			if used is not None:
+				text = "%d%%" % used
+		return text
 
 	text = property(getText)
+
+	range = 100
+
+	@cached
+	def getValue(self):
+		return self.source.used_percent or 0
+
+	value = property(getValue)
+
+	@cached
+	def getBoolean(self):
+		# True while the shown value could not be refreshed
+		return self.source.stale
+
+	boolean = property(getBoolean)
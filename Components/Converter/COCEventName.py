@@ -20,10 +20,17 @@
 
 
 from Components.Converter.Converter import Converter
-from Components.Element import cached
-from Tools.Log import Log
+from Components.Element import cached, ElementError
+from Plugins.SystemPlugins.ComponentsCockpit.EventParts import getEventParts, getEventFingerprint
+from Plugins.SystemPlugins.ComponentsCockpit.TextUtils import TextPager
+from Plugins.SystemPlugins.ComponentsCockpit.Debug import RateLimitedLogger
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+no_repeat_text_log = RateLimitedLogger(interval=3600)
+
+
+@profiled
 class COCEventName(Converter, object):
 
 	# types
@@ -49,6 +56,22 @@ class COCEventName(Converter, object):
 		self._singleShortDesc = "only1ShortDescValues" in args or "singleShortDesc" in args
 		self._noExtDescDoubleNewline = "noExtDescDoubleEnter" in args or "noExtDescDoubleNewline" in args
 		self._noRepeatText = "noRepeatText" in args
+		if self._noRepeatText:
+			no_repeat_text_log.info("noRepeatText is not supported! Sorry!")
+
+		# page mode: text only returns the first page, further pages via getPage()
+		self._maxChars = self._maxLines = 0
+		for arg in args:
+			try:
+				if arg.startswith("maxChars="):
+					self._maxChars = int(arg[9:])
+				elif arg.startswith("maxLines="):
+					self._maxLines = int(arg[9:])
+			except ValueError:
+				raise ElementError("'%s' is not <maxChars|maxLines>=<number> for COCEventName converter" % arg)
+		self.pager = None
+		self.fingerprint = ()
+		self.last_text = ""
 
 		self.type = {
 			"Description": self.SHORT_DESCRIPTION,
@@ -63,85 +86,80 @@ class COCEventName(Converter, object):
 
 	@cached
 	def getText(self):
-		text = ""
+		# spurious changes for the same event keep the previous output
+		fingerprint = getEventFingerprint(self.source.event)
+		if fingerprint != self.fingerprint:
+			self.fingerprint = fingerprint
+			if self._maxChars or self._maxLines:
+				# the extended description is only fetched when a page reaches it
+				self.pager = TextPager(self.getTextParts(), self._maxChars, self._maxLines)
+				text = self.pager.getPage(0)
+			else:
+				text = self.getFullText()
+			self.last_text = text
+		return self.last_text
+
+	text = property(getText)
+
+	def hasPage(self, index):
+		return self.pager is not None and self.pager.hasPage(index)
+
+	def getPage(self, index):
+		if self.pager is None:
+			return ""
+		return self.pager.getPage(index)
+
+	def getFullText(self):
+		return "".join(part() if callable(part) else part for part in self.getTextParts())
+
+	def getTextParts(self):
+		# the text as a list of strings and functions returning the costly parts
+		text_parts = []
 		event = self.source.event
 		if event is not None:
+			parts = getEventParts(event)
 			if self.type == self.NAME:
-				text = event.getEventName()
+				text_parts = [parts.raw_name]
 
 			elif self.type == self.SHORT_DESCRIPTION:
-				text = self._getShortDesc(event)
+				text_parts = [self._getShortDesc(parts)]
 
 			elif self.type == self.EXTENDED_DESCRIPTION:
-				desc = self._getExtendedDesc(event)
-				if desc:
-					if self._noExtDescDoubleNewline:
-						desc = desc.replace("\n\n", "\n").replace("\xc2\x8a\xc2\x8a", "\n")
-					text = desc
+				text_parts = [lambda: parts.getExtendedDesc(self._noExtDescDoubleNewline)]
 
 			elif self.type == self.FULL_DESCRIPTION:
-				desc = self._getShortDesc(event)
+				desc = self._getShortDesc(parts)
 				if desc:
 					desc = "%s\n\n" % (desc, )
-				desc = "%s%s" % (desc, self._getExtendedDesc(event))
-				text = desc
+				text_parts = [desc, lambda: parts.extended]
 
 			elif self.type == self.ID:
-				text = str(event.getEventId())
+				text_parts = [str(event.getEventId())]
 
 			elif self.type == self.NAME_SHORT_DESCRIPTION:
-				name = event.getEventName()
-				desc = self._getShortDesc(event)
+				name = parts.raw_name
+				desc = self._getShortDesc(parts)
 				if desc and desc != name:
 					text = "%s - %s" % (name, desc)
 				text = name
+				text_parts = [text]
 
 			elif self.type == self.SHORT_EXTENDED_DESCRIPTION:
-				desc = self._getShortDesc(event)
-				ext = self._getExtendedDesc(event)
+				desc = self._getShortDesc(parts)
 				if desc:
 					desc = "%s\n" % (desc, )
-				text = "%s%s" % (desc, ext)
+				text_parts = [desc, lambda: parts.extended]
 
 			elif self.type == self.ALL:
-				name = self._filter(event.getEventName())
-				desc = self._getShortDesc(event)
+				desc = self._getShortDesc(parts)
 				if desc:
 					desc = "%s\n\n" % (desc,)
-				ext = self._getExtendedDesc(event)
-				desc = "%s%s" % (desc, ext)
-				text = "%s\n\n%s" % (name, desc)
+				text_parts = ["%s\n\n%s" % (parts.name, desc), lambda: parts.extended]
 
 			elif self.type == self.SHORT_AND_EXTENDED_DESCRIPTION:
-				text = "%s|%s" % (self._getShortDesc(event), self._getExtendedDesc(event))
-
-		return text
-
-	text = property(getText)
-
-	def _filter(self, text):
-		return text.lstrip(" ").lstrip("\n").lstrip("\xc2\x8a").replace("\\n", "\n")
+				text_parts = ["%s|" % self._getShortDesc(parts), lambda: parts.extended]
 
-	def _getExtendedDesc(self, event):
-		return self._filter(event.getExtendedDescription())
+		return text_parts
 
-	def _getShortDesc(self, event):
-		name = self._filter(event.getEventName())
-		desc = self._filter(event.getShortDescription())
-		desc_list = desc.split("\n")
-
-		# remove eventname if first entry in ShortDesc
-		if not self._keepTitle and desc_list[0] == name:
-			desc_list.pop(0)
-
-		# return only 1 values/lines from ShortDesc
-		if self._singleShortDesc:
-			desc_list = desc_list[:1]
-
-		if self._noShortDescNewline:
-			desc = ", ".join(desc_list).strip()
-		else:
-			desc = "\n".join(desc_list).strip()
-		if self._noRepeatText:
-			Log.i("noRepeatText is not supported! Sorry!")
-		return desc
+	def _getShortDesc(self, parts):
+		return parts.getShortDesc(self._keepTitle, self._singleShortDesc, self._noShortDescNewline)
@@ -20,47 +20,118 @@
 
 
 from time import time
+from enigma import eTimer
 from Components.Element import cached
 from Components.Converter.Converter import Converter
-from Poll import Poll
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
-class COCEventTime(Poll, Converter):
+@profiled
+class COCEventTime(Converter, object):
 	POSITION = 1
 	REMAINING = 2
+	PERCENT = 3
+	NEXT_EVENT = 4
 
 	def __init__(self, atype):
 		Converter.__init__(self, atype)
-		Poll.__init__(self)
-		self.poll_interval = 1000
-		self.poll_enabled = True
 		args = atype.split(",")
 		atype = args.pop(0)
 		self.negate = "Negate" in args
+		self.showNoSeconds = "ShowNoSeconds" in args
+		self.resolution = 60 if self.showNoSeconds else 1
 		if atype == "Position":
 			self.type = self.POSITION
 		elif atype == "Remaining":
 			self.type = self.REMAINING
+		elif atype == "Percent":
+			self.type = self.PERCENT
+		elif atype == "NextEvent":
+			self.type = self.NEXT_EVENT
+		self.event_times = None
+		self.polling = False
+		# started when shown, elements begin suspended
+		self.__timer = eTimer()
+		self.__timer_conn = self.__timer.timeout.connect(self.poll)
+
+	def destroy(self):
+		self.__timer.stop()
+		self.__timer_conn = None
+		Converter.destroy(self)
+
+	def startTimer(self):
+		# fire right after the next wall clock second (or minute) boundary
+		delay = self.resolution - time() % self.resolution
+		self.__timer.start(int(delay * 1000) + 10, True)
+
+	def poll(self):
+		self.polling = True
+		try:
+			self.changed((self.CHANGED_POLL,))
+		finally:
+			self.polling = False
+		self.startTimer()
+
+	def doSuspend(self, suspended):
+		if suspended:
+			self.__timer.stop()
+		else:
+			self.event_times = None
+			self.poll()
+
+	def changed(self, what):
+		# the event only changes with a notification of the source,
+		# the own poll ticks reuse its times without fetching the event again
+		if not self.polling:
+			self.event_times = None
+		Converter.changed(self, what)
+
+	def getEventTimes(self):
+		if self.event_times is None:
+			self.event_times = ()
+			event = self.source.event
+			if event:
+				begin = event.getBeginTime()
+				self.event_times = (begin, begin + event.getDuration())
+		return self.event_times
 
 	@cached
 	def getText(self):
 		text = ""
-		event = self.source.event
-		if event:
-			value = 0
-			start_time = event.getBeginTime()
-			duration = event.getDuration()
+		event_times = self.getEventTimes()
+		if event_times:
+			begin, end = event_times
 			now = int(time())
+			if self.type == self.PERCENT:
+				return "%d%%" % self.getValue()
+			value = 0
 			if self.type == self.REMAINING:
-				value = start_time + duration - now
+				value = end - now
 			elif self.type == self.POSITION:
-				value = now - start_time
-			mins = value / 60
-			secs = value % 60
-			if self.negate:
-				mins *= -1
-			text = "%+d:%02d" % (mins, secs)
-
+				value = now - begin
+			elif self.type == self.NEXT_EVENT:
+				value = max(0, end - now)
+			mins, secs = divmod(value, 60)
+			if self.type == self.NEXT_EVENT:
+				text = "%d" % mins if self.showNoSeconds else "%d:%02d" % (mins, secs)
+			else:
+				if self.negate:
+					mins *= -1
+				text = "%+d" % mins if self.showNoSeconds else "%+d:%02d" % (mins, secs)
 		return text
 
 	text = property(getText)
+
+	range = 100
+
+	@cached
+	def getValue(self):
+		value = 0
+		event_times = self.getEventTimes()
+		if event_times:
+			begin, end = event_times
+			if end > begin:
+				value = max(0, min(100, (int(time()) - begin) * 100 // (end - begin)))
+		return value
+
+	value = property(getValue)
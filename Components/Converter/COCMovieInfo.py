@@ -21,10 +21,11 @@
 
 from Components.Element import cached, ElementError
 from Components.Converter.Converter import Converter
-from enigma import iServiceInformation
-from ServiceReference import ServiceReference
+from Plugins.SystemPlugins.ComponentsCockpit.MovieInfoCache import getMovieMeta
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+@profiled
 class COCMovieInfo(Converter):
 	MOVIE_SHORT_DESCRIPTION = 0  # meta description when available.. when not .eit short description
 	MOVIE_META_DESCRIPTION = 1  # just meta description when available
@@ -49,27 +50,27 @@ class COCMovieInfo(Converter):
 
 	@cached
 	def getText(self):
+		# the meta data of the recording is cached against its file stamp,
+		# sources resolving it themselves keep the file system off the GUI thread
 		text = ""
-		service = self.source.service
-		info = self.source.info
-		if info and service:
+		meta = None
+		source = self.source
+		if hasattr(source.__class__, "movie_meta"):
+			meta = source.movie_meta
+		elif source.info and source.service:
+			meta = getMovieMeta(source.service, source.info, lambda: source.event)
+		if meta:
 			if self.type == self.MOVIE_EVENT_DURATION:
-				event = self.source.event
-				if event:
-					text = str(event.getDuration())
-			if self.type == self.MOVIE_SHORT_DESCRIPTION:
-				event = self.source.event
-				if event:
-					text = info.getInfoString(service, iServiceInformation.sDescription)
-					if text == "":
-						text = event.getShortDescription()
+				if meta.duration is not None:
+					text = str(meta.duration)
+			elif self.type == self.MOVIE_SHORT_DESCRIPTION:
+				text = meta.short_description
 			elif self.type == self.MOVIE_META_DESCRIPTION:
-				text = info.getInfoString(service, iServiceInformation.sDescription)
+				text = meta.description
 			elif self.type == self.MOVIE_REC_SERVICE_NAME:
-				rec_ref_str = info.getInfoString(service, iServiceInformation.sServiceref)
-				text = ServiceReference(rec_ref_str).getServiceName()
+				text = meta.service_name
 			elif self.type == self.MOVIE_REC_FILESIZE:
-				filesize = info.getInfoObject(service, iServiceInformation.sFileSize)
+				filesize = meta.file_size
 				if filesize is not None:
 					filesize /= 1024 * 1024
 					if filesize > 0:
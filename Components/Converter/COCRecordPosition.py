@@ -19,14 +19,14 @@
 # <http://www.gnu.org/licenses/>.
 
 
-from Components.Converter.ServicePosition import ServicePosition
+from Components.Converter.COCServicePosition import COCServicePosition
 from Components.Element import cached
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
-class COCRecordPosition(ServicePosition):
-	def __init__(self, atype):
-		ServicePosition.__init__(self, atype)
-		self.poll_interval = 1000
+@profiled
+class COCRecordPosition(COCServicePosition):
+	timeline_field = "record"
 
 	@cached
 	def getCutlist(self):
@@ -34,14 +34,5 @@ class COCRecordPosition(ServicePosition):
 
 	cutlist = property(getCutlist)
 
-	@cached
-	def getPosition(self):
+	def getPlayerPosition(self):
 		return self.source.player.getRecordingPosition()
-
-	position = property(getPosition)
-
-	@cached
-	def getLength(self):
-		return self.source.player.getLength()
-
-	length = property(getLength)
@@ -20,15 +20,20 @@
 
 
 from __future__ import division
-from __future__ import print_function
 from Components.Converter.Converter import Converter
 from Components.Element import cached
 from enigma import (
 	eServiceReference, iServiceInformation, iPlayableService, iAudioType_ENUMS as iAt, CT_MPEG2, CT_H264, CT_MPEG1, CT_MPEG4_PART2, CT_VC1, CT_VC1_SIMPLE_MAIN, CT_H265, CT_DIVX311, CT_DIVX4, CT_SPARK, CT_VP6, CT_VP8, CT_VP9, CT_H263, CT_MJPEG, CT_REAL, CT_AVS, CT_UNKNOWN, iDVBFrontend as FE
 )
 from Tools.Transponder import ConvertToHumanReadable
+from Plugins.SystemPlugins.ComponentsCockpit.Debug import RateLimitedLogger
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+video_params_log = RateLimitedLogger(every=100)
+
+
+@profiled
 class COCServiceInfo(Converter, object):
 	HAS_TELETEXT = 0
 	IS_MULTICHANNEL = 1
@@ -265,7 +270,7 @@ class COCServiceInfo(Converter, object):
 			yres = info.getInfo(iServiceInformation.sVideoHeight)
 			frame_rate = info.getInfo(iServiceInformation.sFrameRate)
 			progressive = info.getInfo(iServiceInformation.sProgressive)
-			print("yres", yres, "frame_rate", frame_rate, "progressive", progressive)
+			video_params_log.debug("yres: %s, frame_rate: %s, progressive: %s", yres, frame_rate, progressive)
 			if not progressive:
 				frame_rate *= 2
 			frame_rate = (frame_rate + 500) // 1000
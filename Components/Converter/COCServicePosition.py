@@ -19,16 +19,29 @@
 # <http://www.gnu.org/licenses/>.
 
 
-import time
+from time import time
 from Components.Converter.ServicePosition import ServicePosition
 from Components.Element import cached
+from Plugins.SystemPlugins.ComponentsCockpit.TimeUtils import cachedLocaltime
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+@profiled
 class COCServicePosition(ServicePosition):
+	timeline_field = "position"
 
 	def __init__(self, atype):
 		ServicePosition.__init__(self, atype)
 		self.poll_interval = 1000
+		self.use_timeline = False
+		self.formatter = self.createFormatter()
+
+	def connect(self, source):
+		ServicePosition.connect(self, source)
+		# COCTimeline samples the player once per tick for all its converters
+		self.use_timeline = hasattr(source.__class__, "timeline")
+		if self.use_timeline:
+			self.poll_enabled = False
 
 	@cached
 	def getCutlist(self):
@@ -43,64 +56,78 @@ class COCServicePosition(ServicePosition):
 
 	@cached
 	def getLength(self):
+		if self.use_timeline:
+			return self.source.timeline.length
 		return self.source.player.getLength()
 
 	length = property(getLength)
 
 	@cached
 	def getPosition(self):
-		return self.source.player.getPosition()
+		if self.use_timeline:
+			return getattr(self.source.timeline, self.timeline_field)
+		return self.getPlayerPosition()
 
 	position = property(getPosition)
 
+	def getPlayerPosition(self):
+		return self.source.player.getPosition()
+
 	@cached
 	def getTime(self):
 		return self.getLength() / 90000
 
 	time = property(getTime)
 
+	def createFormatter(self):
+		if self.type == self.TYPE_ENDTIME:
+			fmt = "%02d:%02d" if self.showNoSeconds else "%02d:%02d:%02d"
+			ahead = ">" + fmt
+			behind = fmt + "<"
+			fields = 5 if self.showNoSeconds else 6
+
+			def formatEndTime(pos):
+				pos //= 90000
+				return (ahead if pos >= 0 else behind) % cachedLocaltime(time() + pos)[3:fields]
+			return formatEndTime
+
+		negate = self.negate
+		signed = self.type != self.TYPE_LENGTH
+		show_hours = self.showHours
+		fmt = "%s%d:%02d" if show_hours else "%s%d"
+		if self.showNoSeconds:
+			fields = 3 if show_hours else 2
+		else:
+			fmt += ":%02d"
+			fields = 4 if show_hours else 3
+			if self.detailed:
+				fmt += ":%03d"
+				fields += 1
+
+		def formatPosition(pos):
+			if negate:
+				pos = -pos
+			sign = ("-" if pos < 0 else "+") if signed else ""
+			secs, ticks = divmod(abs(pos), 90000)
+			mins, secs = divmod(secs, 60)
+			if show_hours:
+				hours, mins = divmod(mins, 60)
+				return fmt % (sign, hours, mins, secs, ticks // 90)[:fields]
+			return fmt % (sign, mins, secs, ticks // 90)[:fields]
+		return formatPosition
+
 	@cached
 	def getText(self):
-		text = ""
-		pos = 0
-		seek = self.getSeek()
-		if seek is not None:
-			if self.type == self.TYPE_ENDTIME:
-				pos = (self.length - self.position) / 90000
-				t = time.localtime(time.time() + pos)
-				text = "%02d:%02d" % (t.tm_hour, t.tm_min)
-				if not self.showNoSeconds:
-					text += ":%02d" % t.tm_sec
-				if pos >= 0:
-					text = ">" + text
-				else:
-					text = text + "<"
-			else:
-				if self.type == self.TYPE_LENGTH:
-					pos = self.length
-				elif self.type == self.TYPE_POSITION:
-					pos = self.position
-				elif self.type == self.TYPE_REMAINING:
-					pos = self.length - self.position
-
-				pos = -pos if self.negate else pos
-				if self.type == self.TYPE_LENGTH:
-					sign = ""
-				else:
-					sign = "-" if pos < 0 else "+"
-
-				pos = abs(pos)
-				milliseconds = (pos % 90000) / 90
-				pos /= 90000
-				if self.showHours:
-					text += sign + "%d" % (pos / 3600)  # hours
-					text += ":%02d" % (pos % 3600 / 60)  # minutes
-				else:
-					text += sign + "%d" % (pos / 60)  # minutes
-				if not self.showNoSeconds:
-					text += ":%02d" % (pos % 60)  # seconds
-					if self.detailed:
-						text += ":%03d" % milliseconds  # milliseconds
-		return text
+		if self.getSeek() is None:
+			return ""
+		if self.type == self.TYPE_LENGTH:
+			pos = self.length
+		elif self.type == self.TYPE_POSITION:
+			pos = self.position
+		elif self.type in (self.TYPE_REMAINING, self.TYPE_ENDTIME):
+			pos = self.length - self.position
+		else:
+			pos = 0
+		return self.formatter(pos)
 
 	text = property(getText)
@@ -20,8 +20,10 @@
 
 
 from Components.Converter.ServiceTime import ServiceTime
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+@profiled
 class COCServiceTime(ServiceTime):
 	def __init__(self, atype):
 		ServiceTime.__init__(self, atype)
@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from Components.Converter.Converter import Converter
+from Components.Element import cached, ElementError
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
+
+
+@profiled
+class COCTimelineInfo(Converter, object):
+	BEHIND_LIVE = 0  # time the play position lags the recording head
+	BUFFER_FILL = 1  # recorded part of the timeshift buffer in percent
+
+	def __init__(self, atype):
+		Converter.__init__(self, atype)
+		if atype == "BehindLive":
+			self.type = self.BEHIND_LIVE
+		elif atype == "BufferFill":
+			self.type = self.BUFFER_FILL
+		else:
+			raise ElementError("'%s' is not <BehindLive|BufferFill> for COCTimelineInfo converter" % atype)
+
+	@cached
+	def getText(self):
+		text = ""
+		sample = self.source.timeline
+		if self.type == self.BEHIND_LIVE:
+			secs = sample.behind_live
+			if secs is not None:
+				text = "-%d:%02d" % divmod(secs, 60)
+		elif self.type == self.BUFFER_FILL:
+			fill = sample.buffer_fill
+			if fill is not None:
+				text = "%d%%" % fill
+		return text
+
+	text = property(getText)
+
+	@cached
+	def getBoolean(self):
+		if self.type == self.BEHIND_LIVE:
+			return bool(self.source.timeline.behind_live)
+		return bool(self.source.timeline.buffer_fill)
+
+	boolean = property(getBoolean)
+
+	range = 100
+
+	@cached
+	def getValue(self):
+		sample = self.source.timeline
+		if self.type == self.BEHIND_LIVE:
+			delay = sample.live_delay
+			if delay is None or not sample.length:
+				return 0
+			return min(100, delay * 100 // sample.length)
+		return sample.buffer_fill or 0
+
+	value = property(getValue)
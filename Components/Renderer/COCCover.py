@@ -19,21 +19,45 @@
 # <http://www.gnu.org/licenses/>.
 
 
+from zlib import crc32
 from enigma import ePixmap, gPixmapPtr, ePicLoad
 from Components.Renderer.Renderer import Renderer
 from Components.AVSwitch import AVSwitch
+from Plugins.SystemPlugins.ComponentsCockpit.LRUCache import LRUCache
+from Plugins.SystemPlugins.ComponentsCockpit.ThumbnailCache import getThumbnailPath, findThumbnail, requestThumbnail, removeThumbnail
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 
 
+PIXMAP_CACHE_SIZE = 64
+PIXMAP_CACHE_BYTES = 16 * 1024 * 1024
+# decoded covers of all renderers, keyed by (cover checksum, cover length, width, height, scale)
+pixmap_cache = LRUCache(PIXMAP_CACHE_SIZE, PIXMAP_CACHE_BYTES)
+
+
+@profiled
 class COCCover(Renderer):
 	GUI_WIDGET = ePixmap
 
 	def __init__(self):
 		self.skinAttributes = None
 		Renderer.__init__(self)
+		self.scale = None
+		self.picload = None
+		self.picload_conn = None
+		self.picload_size = None
+		self.wanted_key = None  # key of the cover to be shown
+		self.decoding_key = None  # key of the cover the decoder is busy with
+		self.decoding_thumbnail = None  # thumbnail and cover the decoder is busy with, to fall back to the cover
+		self.pending = None  # newest cover waiting for the decoder
 
 	def destroy(self):
 		Renderer.destroy(self)
 
+	def preWidgetRemove(self, _instance):
+		self.pending = self.wanted_key = self.decoding_key = self.decoding_thumbnail = None
+		self.picload_conn = None
+		self.picload = None
+
 	def applySkin(self, desktop, parent):
 		attribs = self.skinAttributes
 		for (attrib, value) in self.skinAttributes:
@@ -45,19 +69,78 @@ class COCCover(Renderer):
 
 	def changed(self, what):
 		if self.instance is not None:
+			cover = None
 			if what[0] != self.CHANGED_CLEAR:
-				if self.source.cover:
-					scale = AVSwitch().getFramebufferScale()
-					size = self.instance.size()
-					self.picload = ePicLoad()
-					self.picload_conn = self.picload.PictureData.connect(self.displayPixmapCallback)
-					self.picload.setPara((size.width(), size.height(), scale[0], scale[1], False, 1, "#ff000000"))
-					self.picload.startDecodeBuffer(bytearray(self.source.cover), len(self.source.cover), False)
-				else:
-					self.instance.setPixmap(gPixmapPtr())
+				cover = self.source.cover
+			if cover:
+				if self.scale is None:
+					self.scale = tuple(AVSwitch().getFramebufferScale())
+				size = self.instance.size()
+				size = (size.width(), size.height())
+				key = (crc32(cover) & 0xffffffff, len(cover), size[0], size[1], self.scale)
+				self.wanted_key = key
+				pixmap = pixmap_cache.get(key)
+				if pixmap is not None:
+					self.pending = None
+					self.instance.setPixmap(pixmap)
+				elif self.decoding_key is None:
+					self.startDecode(key, cover, size, self.getThumbnail(key, cover, size))
+				elif self.decoding_key != key:
+					# decoder busy: only the newest cover is decoded next
+					self.pending = (key, cover, size, self.getThumbnail(key, cover, size))
 			else:
+				self.wanted_key = self.pending = None
 				self.instance.setPixmap(gPixmapPtr())
 
+	def getThumbnail(self, key, cover, size):
+		# returns a pre-scaled thumbnail file of the cover, creates one in the background if missing
+		thumbnail_path = getThumbnailPath(key[0], key[1], size)
+		thumbnail = findThumbnail(thumbnail_path)
+		if thumbnail is None:
+			requestThumbnail(thumbnail_path, cover, size)
+		return thumbnail
+
+	def startDecode(self, key, cover, size, thumbnail=None):
+		if self.picload is None:
+			self.picload = ePicLoad()
+			self.picload_conn = self.picload.PictureData.connect(self.displayPixmapCallback)
+		if size != self.picload_size:
+			self.picload_size = size
+			self.picload.setPara((size[0], size[1], self.scale[0], self.scale[1], False, 1, "#ff000000"))
+		self.decoding_key = key
+		self.decoding_thumbnail = None
+		result = 1
+		if thumbnail:
+			result = self.picload.startDecode(thumbnail)
+			if result:
+				removeThumbnail(thumbnail)
+			else:
+				self.decoding_thumbnail = (thumbnail, cover, size)
+		if result:
+			# the decoder only takes a bytearray, this is the only copy of the cover
+			result = self.picload.startDecodeBuffer(bytearray(cover), len(cover), False)
+		if result:
+			self.decoding_key = None
+
 	def displayPixmapCallback(self, picinfo=None):
-		if self.picload and picinfo:
-			self.instance.setPixmap(self.picload.getData())
+		key = self.decoding_key
+		decoding_thumbnail = self.decoding_thumbnail
+		self.decoding_key = self.decoding_thumbnail = None
+		if self.picload and not picinfo and decoding_thumbnail and key is not None:
+			# unreadable thumbnail: decode the cover itself
+			thumbnail, cover, size = decoding_thumbnail
+			removeThumbnail(thumbnail)
+			self.startDecode(key, cover, size)
+			return
+		if self.picload and picinfo and key is not None:
+			pixmap = self.picload.getData()
+			# ARGB pixmap of the widget size
+			pixmap_cache.put(key, pixmap, key[2] * key[3] * 4)
+			# results for a cover that was replaced meanwhile are cached but not shown
+			if key == self.wanted_key:
+				self.instance.setPixmap(pixmap)
+		if self.pending:
+			pending = self.pending
+			self.pending = None
+			if pending[0] == self.wanted_key:
+				self.startDecode(*pending)
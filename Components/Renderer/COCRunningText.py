@@ -33,6 +33,8 @@
 # change made by dream-apha: support for 2 texts/smaller or bigger text area
 
 from Renderer import Renderer
+from Plugins.SystemPlugins.ComponentsCockpit.TextUtils import flattenText
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
 from skin import parseColor, parseFont
 from enigma import eWidget, eLabel, eTimer, ePoint, eSize, gFont, fontRenderClass, \
 	RT_HALIGN_LEFT, RT_HALIGN_CENTER, RT_HALIGN_RIGHT, RT_HALIGN_BLOCK, \
@@ -55,6 +57,7 @@ CENTER = 2
 BLOCK = 3
 
 
+@profiled
 class COCRunningText(Renderer):
 	def __init__(self):
 		Renderer.__init__(self)
@@ -260,7 +263,7 @@ class COCRunningText(Renderer):
 		self.X = self.Y = 0
 		self.setWidgetSizePosition()
 		if not self.txtflags & RT_WRAP:
-			self.txtext = self.txtext.replace("\xe0\x8a", " ").replace(chr(0x8A), " ").replace("\n", " ").replace("\r", " ")
+			self.txtext = flattenText(self.txtext)
 		self.scroll_label.setText(self.txtext)
 
 		if self.txtext == "" or self.type == NONE or self.scroll_label is None:
@@ -22,8 +22,12 @@
 from Components.Element import cached
 from Components.Sources.CurrentService import CurrentService
 from Components.Sources.Event import Event
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
+from Plugins.SystemPlugins.ComponentsCockpit.TraceRecorder import traced, getEventState, getInfoState
 
 
+@profiled
+@traced
 class COCCurrentService(CurrentService, Event):
 	def __init__(self, navcore, player):
 		CurrentService.__init__(self, navcore)
@@ -59,3 +63,12 @@ class COCCurrentService(CurrentService, Event):
 		return self.__player
 
 	player = property(getCurrentPlayer)
+
+	def getTraceState(self):
+		player = self.player
+		return {
+			"position": player.getPosition(),
+			"length": player.getLength(),
+			"info": getInfoState(self.info),
+			"event": getEventState(self.event),
+		}
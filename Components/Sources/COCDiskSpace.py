@@ -21,15 +21,70 @@
 
 from Components.Element import cached
 from Components.Sources.Source import Source
+from Plugins.SystemPlugins.ComponentsCockpit.DiskSpaceCache import getDiskSpaceEntry, getMountKey
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
+from Plugins.SystemPlugins.ComponentsCockpit.TraceRecorder import traced
 
 
+@profiled
+@traced
 class COCDiskSpace(Source):
-	def __init__(self, player):
+	def __init__(self, player, bookmarks=None):
 		Source.__init__(self)
 		self.__player = player
+		# sources for bookmarks on the same mounts share one cache entry,
+		# without bookmarks all sources of the same player class share one
+		key = getMountKey(bookmarks) if bookmarks else None
+		if not key:
+			key = player.__class__.__name__
+		self.__entry = getDiskSpaceEntry(key, bookmarks)
+		self.__entry.callbacks.append(self.gotEntryChanged)
+
+	def destroy(self):
+		if self.gotEntryChanged in self.__entry.callbacks:
+			self.__entry.callbacks.remove(self.gotEntryChanged)
+		Source.destroy(self)
+
+	def gotEntryChanged(self):
+		self.changed((self.CHANGED_ALL,))
 
 	@cached
 	def getDiskSpace(self):
-		return self.__player.getBookmarksSpaceInfo()
+		# always answers with the last known value at once
+		self.__entry.refresh(self.__player.getBookmarksSpaceInfo)
+		return self.__entry.value
 
 	space = property(getDiskSpace)
+
+	@cached
+	def getStale(self):
+		return self.__entry.stale
+
+	stale = property(getStale)
+
+	@cached
+	def getWriteRate(self):
+		return self.__entry.getWriteRate()
+
+	write_rate = property(getWriteRate)
+
+	@cached
+	def getHoursLeft(self):
+		return self.__entry.getHoursLeft()
+
+	hours_left = property(getHoursLeft)
+
+	@cached
+	def getUsedPercent(self):
+		return self.__entry.getUsedPercent()
+
+	used_percent = property(getUsedPercent)
+
+	def getTraceState(self):
+		return {
+			"space": self.space,
+			"stale": self.stale,
+			"write_rate": self.write_rate,
+			"hours_left": self.hours_left,
+			"used_percent": self.used_percent,
+		}
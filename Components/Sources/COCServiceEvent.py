@@ -19,23 +19,94 @@
 # <http://www.gnu.org/licenses/>.
 
 
+from twisted.internet.threads import deferToThread
 from Components.Element import cached
 from Components.Sources.ServiceEvent import ServiceEvent
+from Plugins.SystemPlugins.ComponentsCockpit.Debug import logger
+from Plugins.SystemPlugins.ComponentsCockpit.MovieInfoCache import getMovieMeta, getMovieCover, initCoverInvalidation
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
+from Plugins.SystemPlugins.ComponentsCockpit.TraceRecorder import traced, getEventState
 
 
+@profiled
+@traced
 class COCServiceEvent(ServiceEvent):
-	def __init__(self, servicecenter):
+	def __init__(self, servicecenter, threaded=False):
 		ServiceEvent.__init__(self)
 		self.__servicecenter = servicecenter
+		# threaded: info, event, cover and movie meta data are resolved in the reactor thread pool,
+		# downstream sees None until the data has arrived
+		self.__threaded = threaded
+		self.__resolved = None
+		initCoverInvalidation()
+
+	def newService(self, ref):
+		if self.__threaded and ref and (not self.service or self.service != ref):
+			self.__resolved = None
+			deferToThread(self.__resolve, ref).addCallbacks(self.__gotResolved, self.__gotError, errbackArgs=(ref,))
+		ServiceEvent.newService(self, ref)
+
+	def __resolve(self, service):
+		info = self.__servicecenter.info(service)
+		event = info and info.getEvent(service)
+		cover = info and getMovieCover(service, info)
+		meta = info and getMovieMeta(service, info, lambda: event)
+		return service, info, event, cover, meta
+
+	def __gotResolved(self, result):
+		# discard results for a service that is no longer current
+		if result[0] is self.service:
+			self.__resolved = result
+			self.changed((self.CHANGED_ALL,))
+
+	def __gotError(self, failure, service):
+		logger.error("service: %s, failure: %s", service and service.toString(), failure.getErrorMessage())
+
+	def __getResolved(self, index):
+		if self.__resolved and self.__resolved[0] is self.service:
+			return self.__resolved[index]
+		return None
 
 	@cached
 	def getInfo(self):
+		if self.__threaded:
+			return self.__getResolved(1)
 		return self.service and self.__servicecenter.info(self.service)
 
 	info = property(getInfo)
 
+	@cached
+	def getCurrentEvent(self):
+		if self.__threaded:
+			return self.__getResolved(2)
+		return ServiceEvent.getCurrentEvent(self)
+
+	event = property(getCurrentEvent)
+
 	@cached
 	def getCover(self):
-		return self.service and self.__servicecenter.info(self.service).getCover()
+		if self.__threaded:
+			return self.__getResolved(3)
+		info = self.info
+		return info and getMovieCover(self.service, info)
 
 	cover = property(getCover)
+
+	@cached
+	def getMeta(self):
+		if self.__threaded:
+			return self.__getResolved(4)
+		info = self.info
+		return info and getMovieMeta(self.service, info, lambda: self.event)
+
+	movie_meta = property(getMeta)
+
+	def getTraceState(self):
+		service = self.service
+		info = self.info
+		return {
+			"service": service and service.toString(),
+			"name": info and info.getName(service),
+			"length": info and info.getLength(service),
+			"event": getEventState(self.event),
+		}
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from enigma import eTimer
+from Components.Sources.COCCurrentService import COCCurrentService
+from Plugins.SystemPlugins.ComponentsCockpit.Profiler import profiled
+
+
+class TimelineSample(object):
+	__slots__ = ("position", "before", "record", "length")
+
+	def __init__(self, position, before, record, length):
+		self.position = position
+		self.before = before
+		self.record = record
+		self.length = length
+
+	@property
+	def live_delay(self):
+		# pts between recording head and play position
+		if self.record is None or self.position is None:
+			return None
+		return max(0, self.record - self.position)
+
+	@property
+	def behind_live(self):
+		delay = self.live_delay
+		return None if delay is None else delay // 90000
+
+	@property
+	def buffer_fill(self):
+		if not self.length or self.record is None:
+			return None
+		return max(0, min(100, self.record * 100 // self.length))
+
+
+@profiled
+class COCTimeline(COCCurrentService):
+	def __init__(self, navcore, player, poll_interval=1000):
+		COCCurrentService.__init__(self, navcore, player)
+		self.poll_interval = poll_interval
+		self.__getPosition = player.getPosition
+		self.__getBeforePosition = getattr(player, "getBeforePosition", None)
+		self.__getRecordingPosition = getattr(player, "getRecordingPosition", None)
+		self.__getLength = player.getLength
+		self.__sample = None
+		self.__timer = eTimer()
+		self.__timer_conn = self.__timer.timeout.connect(self.poll)
+
+	def destroy(self):
+		self.__timer.stop()
+		self.__timer_conn = None
+		COCCurrentService.destroy(self)
+
+	def doSuspend(self, suspended):
+		if suspended:
+			self.__timer.stop()
+		else:
+			self.poll()
+
+	def poll(self):
+		self.changed((self.CHANGED_POLL,))
+		self.__timer.start(self.poll_interval, True)
+
+	def changed(self, *args, **kwargs):
+		self.__sample = None
+		COCCurrentService.changed(self, *args, **kwargs)
+
+	def getTimeline(self):
+		if self.__sample is None:
+			self.__sample = TimelineSample(
+				self.__getPosition(),
+				self.__getBeforePosition and self.__getBeforePosition(),
+				self.__getRecordingPosition and self.__getRecordingPosition(),
+				self.__getLength()
+			)
+		return self.__sample
+
+	timeline = property(getTimeline)
+
+	def getTraceState(self):
+		state = COCCurrentService.getTraceState(self)
+		state["before"] = self.__getBeforePosition and self.__getBeforePosition()
+		state["record"] = self.__getRecordingPosition and self.__getRecordingPosition()
+		return state
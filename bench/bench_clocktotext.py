@@ -0,0 +1,64 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# COCClockToText: clock and date formatting per second and per minute tick
+
+from benchlib import benchmark, main
+from Components.Element import Element
+from fixtures import FakeSource, connectChain
+from Components.Converter.COCClockToText import COCClockToText
+
+
+TYPES = ("Default", "WithSeconds", "Date", "Format:%H:%M", "Format:%A %d.%m.%Y", "Format:Ende %H:%M:%S", "InMinutes", "AsLength")
+START = 1700000000
+
+
+def registerType(atype):
+	@benchmark("ClockToText.%s" % atype, number=20000)
+	def benchFormat():
+		source = FakeSource(time=START)
+		converter = COCClockToText(atype)
+		converter.connect(source)
+
+		def run():
+			source.time += 1
+			return converter.getText()
+		return run
+
+
+for clock_type in TYPES:
+	registerType(clock_type)
+
+
+@benchmark("ClockToText.screen_tick", number=5000)
+def benchScreenTick():
+	source = FakeSource(time=START)
+	for atype in TYPES:
+		connectChain(source, COCClockToText(atype))
+
+	def run():
+		source.time += 1
+		source.notify((Element.CHANGED_POLL,))
+	return run
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# COCEventName: text assembly for new and repeated events across description sizes
+
+from benchlib import benchmark, main
+from Components.Element import Element
+from fixtures import FakeSource, Event, connectChain, makeText
+from Components.Converter.COCEventName import COCEventName
+
+
+SIZES = (("small", 200), ("medium", 2000), ("large", 20000))
+TYPES = ("Name", "Description", "ExtendedDescription", "FullDescription", "All", "ExtendedDescription,maxChars=600,maxLines=12")
+# more distinct events than the shared event parts cache holds
+EVENT_COUNT = 64
+
+
+def createEvents(size):
+	return [
+		Event(i, "Tatort %d" % i, "Tatort %d\nKrimi, D 2024\n%s" % (i, makeText(size // 10, i)), makeText(size, i), begin=1700000000 + i * 3600)
+		for i in range(EVENT_COUNT)
+	]
+
+
+def createScreen(events):
+	source = FakeSource(event=events[0])
+	for atype in TYPES:
+		connectChain(source, COCEventName(atype))
+	return source
+
+
+def registerSize(label, size):
+	@benchmark("EventName.new_event.%s" % label, number=200)
+	def benchNewEvent():
+		events = createEvents(size)
+		source = createScreen(events)
+		state = [0]
+
+		def run():
+			i = state[0] = (state[0] + 1) % len(events)
+			source.event = events[i]
+			source.notify((Element.CHANGED_ALL,))
+		return run
+
+	@benchmark("EventName.same_event.%s" % label, number=2000)
+	def benchSameEvent():
+		source = createScreen(createEvents(size))
+
+		def run():
+			source.notify((Element.CHANGED_ALL,))
+		return run
+
+
+for size_label, text_size in SIZES:
+	registerSize(size_label, text_size)
+
+
+if __name__ == "__main__":
+	main()
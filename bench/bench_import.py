@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# import cost of the plugin as paid on every enigma2 boot: the package, Debug and plugin.py
+
+import os
+import sys
+import logging
+import importlib
+import compileall
+from benchlib import BENCH_DIR, benchmark, main
+from Components.Language import language
+
+
+PACKAGE = "Plugins.SystemPlugins.ComponentsCockpit"
+
+
+def compilePackage():
+	# the box imports byte compiled modules, also when bytecode writing is disabled here
+	compileall.compile_dir(os.path.join(BENCH_DIR, "..", "src"), quiet=1)
+	compileall.compile_dir(os.path.join(BENCH_DIR, "stubs"), quiet=1)
+
+
+def unloadPackage():
+	modules = {}
+	for name in [name for name in sys.modules if name == PACKAGE or name.startswith(PACKAGE + ".")]:
+		modules[name] = sys.modules.pop(name)
+	return modules
+
+
+def importPackage(module):
+	modules = unloadPackage()
+	callbacks = len(language.callbacks)
+	handlers = logging.getLogger("COC").handlers
+	logging.getLogger("COC").handlers = []
+	try:
+		return importlib.import_module(module)
+	finally:
+		# undo what the import registered, so every run starts from the same state,
+		# and put back the modules other benchmarks hold on to: python 2 clears
+		# the globals of a module when it is released
+		del language.callbacks[callbacks:]
+		logging.getLogger("COC").handlers = handlers
+		unloadPackage()
+		sys.modules.update(modules)
+
+
+@benchmark("Import.plugin", number=50)
+def benchImportPlugin():
+	compilePackage()
+	return lambda: importPackage(PACKAGE + ".plugin")
+
+
+@benchmark("Import.first_translation", number=50)
+def benchFirstTranslation():
+	compilePackage()
+
+	def run():
+		return importPackage(PACKAGE)._("min")
+	return run
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,48 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# replays the synthetic scenarios and any traces recorded on a box into bench/traces/
+
+import os
+import glob
+from benchlib import BENCH_DIR, benchmark, main
+from replay import TraceReplayer, loadTrace, readTrace
+from synthetic_traces import SCENARIOS
+
+
+def registerTrace(name, load):
+	@benchmark("Replay.%s" % name, number=3)
+	def benchReplay():
+		replayer = TraceReplayer(load()[1])
+		replayer.replay()
+		return replayer.replay
+	return benchReplay
+
+
+for scenario_name, scenario in SCENARIOS.items():
+	registerTrace(scenario_name, lambda scenario=scenario: loadTrace(scenario()))
+
+for trace_path in sorted(glob.glob(os.path.join(BENCH_DIR, "traces", "*.trace"))):
+	registerTrace(os.path.basename(trace_path)[:-6], lambda trace_path=trace_path: readTrace(trace_path))
+
+
+if __name__ == "__main__":
+	main()
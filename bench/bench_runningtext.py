@@ -0,0 +1,73 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# COCRunningText: layout of a new text and the cost of one scroll step
+
+from benchlib import benchmark, main
+from fixtures import FakeSource, createRunningText, makeText
+
+
+OPTIONS = {
+	"running_left": "movetype=running,direction=left,startdelay=0,steptime=50,step=2,wrap=0",
+	"running_top": "movetype=running,direction=top,startdelay=0,steptime=50,step=1,wrap=1",
+	"swimming_top": "movetype=swimming,direction=top,startdelay=0,pagedelay=2000,pagelength=60,wrap=1",
+}
+TEXT_SIZE = 2000
+
+
+def createRenderer(options, text):
+	source = FakeSource(text=text)
+	return source, createRunningText(source, options)
+
+
+def registerOptions(label, options):
+	@benchmark("RunningText.calcMoving.%s" % label, number=2000)
+	def benchCalcMoving():
+		renderer = createRenderer(options, makeText(TEXT_SIZE))[1]
+		return renderer.calcMoving
+
+	@benchmark("RunningText.movingLoop.%s" % label, number=50000)
+	def benchMovingLoop():
+		renderer = createRenderer(options, makeText(TEXT_SIZE))[1]
+		if not renderer.calcMoving():
+			raise RuntimeError("text does not move with options: %s" % options)
+		return renderer.movingLoop
+
+
+for options_label, skin_options in sorted(OPTIONS.items()):
+	registerOptions(options_label, skin_options)
+
+
+@benchmark("RunningText.changed", number=2000)
+def benchChanged():
+	texts = [makeText(TEXT_SIZE, i) for i in range(16)]
+	source, renderer = createRenderer(OPTIONS["running_left"], texts[0])
+	state = [0]
+
+	def run():
+		i = state[0] = (state[0] + 1) % len(texts)
+		source.text = texts[i]
+		renderer.changed((renderer.CHANGED_DEFAULT,))
+	return run
+
+
+if __name__ == "__main__":
+	main()
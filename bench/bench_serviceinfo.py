@@ -0,0 +1,79 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# COCServiceInfo: cost of one service event reaching a skin's service info converters
+
+from benchlib import benchmark, main
+from enigma import iPlayableService
+from Components.Element import Element
+from fixtures import FakeSource, PlayableService, connectChain
+from Components.Converter.COCServiceInfo import COCServiceInfo
+
+
+TEXT_TYPES = ("VideoParams", "VideoInfo", "VideoWidth", "VideoHeight", "Framerate", "VideoCodec", "Provider", "Frequency", "SatPos", "TpData,modulation", "Multi,%T %FR %P %SR")
+BOOLEAN_TYPES = ("IsCrypted", "IsWidescreen", "IsMultichannel", "HasTelext", "IsStream")
+EVENTS = (iPlayableService.evStart, iPlayableService.evUpdatedInfo, iPlayableService.evVideoSizeChanged, iPlayableService.evVideoFramerateChanged, iPlayableService.evUpdatedEventInfo)
+
+
+def createScreen():
+	source = FakeSource(service=PlayableService())
+	readers = [connectChain(source, COCServiceInfo(atype)) for atype in TEXT_TYPES]
+	readers += [connectChain(source, COCServiceInfo(atype), "boolean") for atype in BOOLEAN_TYPES]
+	return source, readers
+
+
+@benchmark("ServiceInfo.event", number=2000)
+def benchEvent():
+	source = createScreen()[0]
+	events = [(Element.CHANGED_SPECIFIC, event) for event in EVENTS]
+	state = [0]
+
+	def run():
+		i = state[0] = (state[0] + 1) % len(events)
+		source.notify(events[i])
+	return run
+
+
+@benchmark("ServiceInfo.zap", number=2000)
+def benchZap():
+	source = createScreen()[0]
+
+	def run():
+		source.notify((Element.CHANGED_ALL,))
+	return run
+
+
+@benchmark("ServiceInfo.getText.VideoParams", number=20000)
+def benchVideoParams():
+	converter = COCServiceInfo("VideoParams")
+	converter.connect(FakeSource(service=PlayableService()))
+	return lambda: converter.getText()
+
+
+@benchmark("ServiceInfo.getText.Multi", number=20000)
+def benchMulti():
+	converter = COCServiceInfo("Multi,%T %FR %P %SR %S")
+	converter.connect(FakeSource(service=PlayableService()))
+	return lambda: converter.getText()
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,68 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# COCServicePosition: cost of one poll tick for the usual infobar position texts
+
+from benchlib import benchmark, main
+from Components.Element import Element
+from fixtures import FakeSource, PlayableService, Player, Seek, connectChain
+from Components.Converter.COCServicePosition import COCServicePosition
+
+
+TYPES = ("Position", "Remaining,ShowHours", "Length,ShowHours", "Remaining,Negate", "Position,Detailed", "EndTime,ShowNoSeconds", "EndTime")
+
+
+@benchmark("ServicePosition.tick", number=5000)
+def benchTick():
+	seek = Seek(0, 90000 * 5400)
+	source = FakeSource(service=PlayableService(seek=seek), player=Player(seek))
+	converters = []
+	for atype in TYPES:
+		converter = COCServicePosition(atype)
+		connectChain(source, converter)
+		converters.append(converter)
+
+	def run():
+		seek.position = (seek.position + 90000) % seek.length
+		for converter in converters:
+			converter.changed((Element.CHANGED_POLL,))
+	return run
+
+
+def registerType(atype):
+	@benchmark("ServicePosition.getText.%s" % atype, number=20000)
+	def benchText():
+		seek = Seek(90000 * 1234, 90000 * 5400)
+		converter = COCServicePosition(atype)
+		converter.connect(FakeSource(service=PlayableService(seek=seek), player=Player(seek)))
+
+		def run():
+			seek.position += 90000
+			return converter.getText()
+		return run
+
+
+for position_type in ("Position", "Remaining,ShowHours", "EndTime"):
+	registerType(position_type)
+
+
+if __name__ == "__main__":
+	main()
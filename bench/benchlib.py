@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# timing harness for the headless benchmarks; importing it puts the enigma stand-ins on sys.path
+
+import os
+import sys
+import gc
+import json
+import argparse
+from timeit import default_timer
+from collections import OrderedDict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "stubs"))
+sys.path.insert(0, BENCH_DIR)
+
+DEFAULT_REPEAT = 5
+benchmarks = OrderedDict()
+
+
+class Benchmark(object):
+	def __init__(self, name, setup, number):
+		self.name = name
+		self.setup = setup
+		self.number = number
+
+
+def benchmark(name, number=1000):
+	# registers a setup function returning the callable to be timed
+	def register(setup):
+		benchmarks[name] = Benchmark(name, setup, number)
+		return setup
+	return register
+
+
+def timeBenchmark(bench, repeat=DEFAULT_REPEAT):
+	# best of several runs, with the collector off as timeit does
+	func = bench.setup()
+	number = bench.number
+	timings = []
+	gc_enabled = gc.isenabled()
+	gc.disable()
+	try:
+		for _i in range(repeat):
+			start = default_timer()
+			for _j in range(number):
+				func()
+			timings.append(default_timer() - start)
+	finally:
+		if gc_enabled:
+			gc.enable()
+	best = min(timings)
+	return {
+		"name": bench.name,
+		"number": number,
+		"repeat": repeat,
+		"best_us": best * 1e6 / number,
+		"mean_us": sum(timings) * 1e6 / (number * repeat),
+		"ops_per_sec": number / best if best else 0,
+	}
+
+
+def selectBenchmarks(patterns):
+	if not patterns:
+		return list(benchmarks.values())
+	return [bench for bench in benchmarks.values() if any(pattern in bench.name for pattern in patterns)]
+
+
+def printResult(result):
+	print("%-48s %10.2f us/op %12.0f ops/s" % (result["name"], result["best_us"], result["ops_per_sec"]))
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="ComponentsCockpit headless benchmarks")
+	parser.add_argument("patterns", nargs="*", help="only run benchmarks whose name contains one of these")
+	parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+	parser.add_argument("--json", help="also write the results to this file")
+	args = parser.parse_args(argv)
+	results = []
+	for bench in selectBenchmarks(args.patterns):
+		result = timeBenchmark(bench, args.repeat)
+		printResult(result)
+		results.append(result)
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump({"python": sys.version.split()[0], "results": results}, f, indent=1, sort_keys=True)
+	return results
@@ -0,0 +1,289 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# stand-in services, players and events that feed the components under benchmark
+
+from enigma import iServiceInformation, iDVBFrontend, CT_H264, eWidget
+from Components.Element import Element
+from Components.Sources.Source import Source
+from Components.Renderer.COCRunningText import COCRunningText
+
+
+class ServiceInfo(object):
+	def __init__(self, values=None, strings=None, transponder=None):
+		self.values = {
+			iServiceInformation.sVideoWidth: 1920,
+			iServiceInformation.sVideoHeight: 1080,
+			iServiceInformation.sFrameRate: 25000,
+			iServiceInformation.sProgressive: 0,
+			iServiceInformation.sAspect: 3,
+			iServiceInformation.sVideoType: CT_H264,
+			iServiceInformation.sVideoPID: 0x65,
+			iServiceInformation.sAudioPID: 0x66,
+			iServiceInformation.sPCRPID: 0x65,
+			iServiceInformation.sPMTPID: 0x64,
+			iServiceInformation.sTXTPID: 0x68,
+			iServiceInformation.sSID: 0x2b66,
+			iServiceInformation.sONID: 1,
+			iServiceInformation.sTSID: 0x3fb,
+			iServiceInformation.sIsCrypted: 0,
+			iServiceInformation.sTransferBPS: -1,
+		}
+		self.values.update(values or {})
+		self.strings = {
+			iServiceInformation.sProvider: "ARD",
+			iServiceInformation.sServiceref: "1:0:19:2B66:3F3:1:C00000:0:0:0:",
+			iServiceInformation.sEotf: "",
+		}
+		self.strings.update(strings or {})
+		self.transponder = transponder if transponder is not None else {
+			"tuner_type": iDVBFrontend.feSatellite,
+			"frequency": 11493750,
+			"symbol_rate": 22000000,
+			"polarization": 0,
+			"modulation": 2,
+			"system": 1,
+			"orbital_position": 192,
+			"fec_inner": 3,
+		}
+
+	def getInfo(self, what):
+		return self.values.get(what, -1)
+
+	def getInfoString(self, what):
+		return self.strings.get(what, "")
+
+	def getInfoObject(self, what):
+		if what == iServiceInformation.sTransponderData:
+			return self.transponder
+		return None
+
+	def getEvent(self, what):
+		return None
+
+
+class StaticServiceInfo(object):
+	# service center information of a movie list entry
+	def __init__(self, name="", length=0, event=None):
+		self.name = name
+		self.length = length
+		self.event = event
+
+	def getName(self, ref):
+		return self.name
+
+	def getLength(self, ref):
+		return self.length
+
+	def getEvent(self, ref):
+		return self.event
+
+
+class Seek(object):
+	def __init__(self, position=0, length=90000 * 3600):
+		self.position = position
+		self.length = length
+
+	def getPlayPosition(self):
+		return (0, self.position)
+
+	def getLength(self):
+		return (0, self.length)
+
+	def isCurrentlySeekable(self):
+		return 3
+
+
+class Player(object):
+	# the Cockpit player interface the COC sources and converters query
+	def __init__(self, seek, service=None, event=None, space_info=""):
+		self.seek = seek
+		self.service = service
+		self.event = event
+		self.space_info = space_info
+		self.before_position = 0
+		self.recording_position = seek.length
+
+	def getPosition(self):
+		return self.seek.position
+
+	def getLength(self):
+		return self.seek.length
+
+	def getBeforePosition(self):
+		return self.before_position
+
+	def getRecordingPosition(self):
+		return self.recording_position
+
+	def getInfo(self):
+		return self.service and self.service.info()
+
+	def getEvent(self):
+		return self.event
+
+	def getBookmarksSpaceInfo(self):
+		return self.space_info
+
+
+class CueSheet(object):
+	def __init__(self, cutlist=None):
+		self.cutlist = cutlist or []
+
+	def getCutList(self):
+		return self.cutlist
+
+
+class AudioTrackInfo(object):
+	def __init__(self, atype):
+		self.atype = atype
+
+	def getType(self):
+		return self.atype
+
+
+class AudioTracks(object):
+	def __init__(self, types):
+		self.tracks = [AudioTrackInfo(atype) for atype in types]
+
+	def getNumberOfTracks(self):
+		return len(self.tracks)
+
+	def getTrackInfo(self, idx):
+		return self.tracks[idx]
+
+
+class PlayableService(object):
+	def __init__(self, info=None, seek=None, audio_types=(0, 1)):
+		self.service_info = info or ServiceInfo()
+		self.service_seek = seek or Seek()
+		self.cue_sheet = CueSheet()
+		self.audio = AudioTracks(audio_types)
+
+	def info(self):
+		return self.service_info
+
+	def seek(self):
+		return self.service_seek
+
+	def cueSheet(self):
+		return self.cue_sheet
+
+	def cutList(self):
+		return self.cue_sheet
+
+	def audioTracks(self):
+		return self.audio
+
+	def subtitleTracks(self):
+		return None
+
+	def subServices(self):
+		return None
+
+
+class Event(object):
+	def __init__(self, event_id, name, short="", extended="", begin=0, duration=3600):
+		self.event_id = event_id
+		self.name = name
+		self.short = short
+		self.extended = extended
+		self.begin = begin
+		self.duration = duration
+
+	def getEventId(self):
+		return self.event_id
+
+	def getEventName(self):
+		return self.name
+
+	def getShortDescription(self):
+		return self.short
+
+	def getExtendedDescription(self):
+		return self.extended
+
+	def getBeginTime(self):
+		return self.begin
+
+	def getDuration(self):
+		return self.duration
+
+
+class FakeSource(Source):
+	# carries whatever attributes a converter reads (service, event, time, text, ...)
+	def __init__(self, **attributes):
+		Source.__init__(self)
+		self.__dict__.update(attributes)
+
+	def notify(self, what):
+		self.changed(what)
+
+
+class Reader(Element):
+	# downstream end of a chain, reading its source like a renderer would
+	def __init__(self, attribute="text"):
+		Element.__init__(self)
+		self.attribute = attribute
+		self.reads = 0
+		self.last = None
+
+	def changed(self, what):
+		if self.source is not None:
+			self.last = getattr(self.source, self.attribute)
+			self.reads += 1
+
+
+def connectChain(source, converter, attribute="text"):
+	converter.connect(source)
+	reader = Reader(attribute)
+	reader.connect(converter)
+	return reader
+
+
+def createRunningText(source, options):
+	renderer = COCRunningText()
+	renderer.skinAttributes = [
+		("position", "0,0"), ("size", "600,120"), ("size2", "600,60"),
+		("font", "Regular;22"), ("options", options),
+	]
+	renderer.connect(source)
+	renderer.GUIcreate(eWidget())
+	renderer.applySkin(None, None)
+	renderer.mShown = 1
+	return renderer
+
+
+def makeText(size, seed=0):
+	# deterministic pseudo text with words, sentences and paragraphs
+	words = ("Doku", "Reportage", "Film", "Deutschland", "2024", "Folge", "Staffel", "Moderation", "Gast", "Regie",
+		"Kamera", "Musik", "Hauptrolle", "Nachrichten", "Wetter", "Sport", "Spielfilm", "Serie", "Krimi", "Thriller")
+	parts = []
+	length = 0
+	i = seed
+	while length < size:
+		word = words[(i * 7 + i // 3) % len(words)]
+		i += 1
+		if i % 13 == 0:
+			word += ".\n" if i % 39 == 0 else "."
+		parts.append(word)
+		length += len(word) + 1
+	return " ".join(parts)[:size]
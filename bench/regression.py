@@ -0,0 +1,300 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# performance regression gate: runs the benchmarks and replayed traces, compares
+# time and allocations with a stored baseline and fails when a component exceeds
+# the budget configured for it in budgets.json
+
+import os
+import sys
+import glob
+import json
+import shutil
+import tempfile
+import platform
+import argparse
+import importlib
+import subprocess
+from benchlib import BENCH_DIR, Benchmark, selectBenchmarks, timeBenchmark
+try:
+	import tracemalloc
+except ImportError:
+	tracemalloc = None
+
+
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+BUDGETS_FILE = os.path.join(BENCH_DIR, "budgets.json")
+REPO_DIR = os.path.dirname(BENCH_DIR)
+ALLOCATION_OPS = 200
+GATE_REPEAT = 10
+GATE_CONFIRM = 3
+
+
+def loadBenchmarks(tolerant=False):
+	# tolerant: benchmarks of components the measured tree does not have yet are left out
+	for path in sorted(glob.glob(os.path.join(BENCH_DIR, "bench_*.py"))):
+		try:
+			importlib.import_module(os.path.basename(path)[:-3])
+		except Exception as e:  # pylint: disable=W0703
+			if not tolerant:
+				raise
+			print("%s: not loaded: %s" % (os.path.basename(path), e))
+
+
+def recordRefBaseline(ref, args, baseline):
+	# records the baseline on this machine from the components of a git ref,
+	# measured with the benchmarks of this tree right before they measure HEAD
+	tree = tempfile.mkdtemp(prefix="coc-baseline-")
+	os.rmdir(tree)
+	subprocess.check_call(["git", "worktree", "add", "--detach", tree, ref], cwd=REPO_DIR)
+	try:
+		bench_dir = os.path.join(tree, "bench")
+		shutil.rmtree(bench_dir, ignore_errors=True)
+		shutil.copytree(BENCH_DIR, bench_dir, ignore=shutil.ignore_patterns("*.pyc", "__pycache__", "baseline.json"))
+		command = [sys.executable, os.path.join(bench_dir, "regression.py"), "--update-baseline", "--baseline", baseline, "--repeat", str(args.repeat)]
+		subprocess.check_call(command + args.patterns)
+	finally:
+		subprocess.call(["git", "worktree", "remove", "--force", tree], cwd=REPO_DIR)
+
+
+def pythonVersion():
+	return "%d.%d" % sys.version_info[:2]
+
+
+def getCpuModel():
+	try:
+		with open("/proc/cpuinfo") as f:
+			for line in f:
+				key, _sep, value = line.partition(":")
+				if key.strip() in ("model name", "Hardware", "cpu model"):
+					return value.strip()
+	except IOError:
+		pass
+	return platform.processor()
+
+
+def hostFingerprint():
+	# timings are only comparable on the host and interpreter that recorded the baseline
+	return {
+		"node": platform.node(),
+		"machine": platform.machine(),
+		"cpu": getCpuModel(),
+		"implementation": platform.python_implementation(),
+		"python": pythonVersion(),
+	}
+
+
+def calibrationWork():
+	# fixed pure python work of the kind the components do: formatting, lookups and joins
+	values = {}
+	for i in range(50):
+		values["key%d" % i] = i
+	return " ".join("%s=%d" % item for item in sorted(values.items()))
+
+
+CALIBRATION = Benchmark("calibration", lambda: calibrationWork, 200)
+
+
+def timeCalibrated(bench, repeat):
+	# the calibration is timed around the benchmark, so a machine that is slower
+	# or busier at the moment scales both alike
+	before = timeBenchmark(CALIBRATION, repeat)["best_us"]
+	result = timeBenchmark(bench, repeat)
+	after = timeBenchmark(CALIBRATION, repeat)["best_us"]
+	result["calibration_us"] = min(before, after)
+	return result
+
+
+def normaliseTime(result, calibration):
+	# the time the benchmark would have taken at the speed the baseline was recorded with;
+	# times are only scaled down, a calibration faster than the baseline is a short boost
+	# of the clock on the same host and would scale ordinary times over their budget
+	if not calibration:
+		return result["best_us"]
+	return result["best_us"] * min(1.0, calibration / result["calibration_us"])
+
+
+def getMedian(values):
+	values = sorted(values)
+	return (values[(len(values) - 1) // 2] + values[len(values) // 2]) / 2.0 if values else None
+
+
+def measureAllocations(bench):
+	# peak and retained traced memory over a run of operations after a warm up
+	if tracemalloc is None:
+		return None
+	func = bench.setup()
+	number = min(bench.number, ALLOCATION_OPS)
+	for _i in range(number):
+		func()
+	tracemalloc.start()
+	try:
+		before = tracemalloc.get_traced_memory()[0]
+		for _i in range(number):
+			func()
+		current, peak = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	return {"peak_kb": (peak - before) / 1024.0, "retained_bytes_per_op": max(0, current - before) / float(number)}
+
+
+def getBudget(budgets, name):
+	# the longest matching component prefix refines the defaults
+	budget = dict(budgets["default"])
+	for prefix in sorted(budgets.get("components", {}), key=len):
+		if name.startswith(prefix):
+			budget.update(budgets["components"][prefix])
+	return budget
+
+
+def checkLimit(value, base, factor, slack):
+	limit = max(base * factor, base + slack)
+	return value <= limit, limit
+
+
+def checkResult(result, base, calibration, budget):
+	failures = []
+	result["normalised_us"] = normaliseTime(result, calibration)
+	ok, result["time_limit_us"] = checkLimit(result["normalised_us"], base["best_us"], budget["time_factor"], budget["time_slack_us"])
+	if not ok:
+		failures.append("time")
+	if result.get("peak_kb") is not None and base.get("peak_kb") is not None:
+		ok, result["peak_limit_kb"] = checkLimit(result["peak_kb"], base["peak_kb"], budget["peak_factor"], budget["peak_slack_kb"])
+		if not ok:
+			failures.append("peak")
+		ok, result["retained_limit_bytes"] = checkLimit(result["retained_bytes_per_op"], base["retained_bytes_per_op"], budget["retained_factor"], budget["retained_slack_bytes"])
+		if not ok:
+			failures.append("retained")
+	return failures
+
+
+def runGate(args):
+	with open(args.budgets) as f:
+		budgets = json.load(f)
+	baseline = {}
+	if os.path.exists(args.baseline) and not args.update_baseline:
+		with open(args.baseline) as f:
+			baseline = json.load(f)
+	host = hostFingerprint()
+	comparable = baseline.get("host") == host
+	calibration = baseline.get("calibration_us")
+	results = []
+	for bench in selectBenchmarks(args.patterns):
+		try:
+			result = timeCalibrated(bench, args.repeat)
+		except Exception as e:  # pylint: disable=W0703
+			if not args.update_baseline:
+				raise
+			print("%-48s not recorded: %s" % (bench.name, e))
+			continue
+		allocations = measureAllocations(bench)
+		if allocations:
+			result.update(allocations)
+		base = baseline.get("results", {}).get(bench.name)
+		if not comparable:
+			result["status"] = "skipped"
+		elif base is None:
+			result["status"] = "new"
+		else:
+			budget = getBudget(budgets, bench.name)
+			failures = checkResult(result, base, calibration, budget)
+			# a time overrun is measured again before it counts, load spikes of the machine pass
+			retries = args.confirm
+			while failures == ["time"] and retries:
+				retries -= 1
+				retry = timeCalibrated(bench, args.repeat)
+				if normaliseTime(retry, calibration) < normaliseTime(result, calibration):
+					result["best_us"], result["calibration_us"] = retry["best_us"], retry["calibration_us"]
+				failures = checkResult(result, base, calibration, budget)
+			result["status"] = "failed" if failures else "ok"
+			result["failures"] = failures
+			result["baseline_us"] = base["best_us"]
+		results.append(result)
+		print("%-48s %10.2f us/op %10s normalised %10s KB peak  %s%s" % (
+			result["name"], result["best_us"], "%.2f" % result["normalised_us"] if "normalised_us" in result else "-",
+			"%.1f" % result["peak_kb"] if allocations else "-",
+			result["status"], (": " + ", ".join(result["failures"])) if result.get("failures") else ""))
+	return {
+		"host": host,
+		"baseline_host": baseline.get("host"),
+		"comparable": comparable,
+		"passed": all(result["status"] != "failed" for result in results),
+		"results": results,
+	}
+
+
+def checkTree(args):
+	loadBenchmarks(tolerant=args.update_baseline)
+	report = runGate(args)
+	if args.results:
+		with open(args.results, "w") as f:
+			json.dump(report, f, indent=1, sort_keys=True)
+	if args.update_baseline:
+		keys = ("best_us", "peak_kb", "retained_bytes_per_op")
+		baseline = {
+			"host": report["host"],
+			# the speed of the machine over the whole run, single disturbed measurements do not count
+			"calibration_us": getMedian([result["calibration_us"] for result in report["results"]]),
+			"results": dict((result["name"], dict((key, result.get(key)) for key in keys)) for result in report["results"]),
+		}
+		with open(args.baseline, "w") as f:
+			json.dump(baseline, f, indent=1, sort_keys=True)
+		print("baseline written to %s" % args.baseline)
+		return 0
+	if not report["comparable"]:
+		if report["baseline_host"] is None:
+			print("no baseline for this host, record one with --update-baseline or use --baseline-ref, nothing compared")
+		else:
+			print("baseline was recorded on another host or python, nothing compared")
+		if not args.allow_missing_baseline:
+			print("FAILED")
+			return 1
+	print("passed" if report["passed"] else "FAILED")
+	return 0 if report["passed"] else 1
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="ComponentsCockpit performance regression gate")
+	parser.add_argument("patterns", nargs="*", help="only check benchmarks whose name contains one of these")
+	parser.add_argument("--repeat", type=int, default=GATE_REPEAT)
+	parser.add_argument("--confirm", type=int, default=GATE_CONFIRM, help="times a benchmark over its time budget is measured again")
+	parser.add_argument("--baseline", default=BASELINE_FILE)
+	parser.add_argument("--baseline-ref", help="record the baseline from this git ref on this machine first, then check the tree")
+	parser.add_argument("--allow-missing-baseline", action="store_true", help="pass when there is no baseline comparable with this host")
+	parser.add_argument("--budgets", default=BUDGETS_FILE)
+	parser.add_argument("--results", help="write the machine readable results to this file")
+	parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+	args = parser.parse_args(argv)
+	if args.baseline_ref:
+		if args.update_baseline:
+			parser.error("--baseline-ref checks the tree against the ref, it does not update a baseline")
+		tmp_dir = tempfile.mkdtemp(prefix="coc-gate-")
+		try:
+			args.baseline = os.path.join(tmp_dir, "baseline.json")
+			recordRefBaseline(args.baseline_ref, args, args.baseline)
+			return checkTree(args)
+		finally:
+			shutil.rmtree(tmp_dir, ignore_errors=True)
+	return checkTree(args)
+
+
+if __name__ == "__main__":
+	sys.exit(main())
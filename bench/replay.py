@@ -0,0 +1,223 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# replays source traces recorded by TraceRecorder through stand-in sources
+# into the COC converters and renderers a typical skin attaches to them;
+# records are replayed back to back, the recorded timing is not reproduced
+
+import sys
+import json
+import argparse
+from timeit import default_timer
+import benchlib  # noqa: F401, pylint: disable=W0611
+from enigma import iServiceInformation, iPlayableService, eServiceReference
+from Components.Element import Element
+from fixtures import FakeSource, PlayableService, ServiceInfo, StaticServiceInfo, Seek, Player, Event, connectChain, createRunningText
+from Components.Converter.COCServiceInfo import COCServiceInfo
+from Components.Converter.COCEventName import COCEventName
+from Components.Converter.COCServicePosition import COCServicePosition
+from Components.Converter.COCDiskSpaceInfo import COCDiskSpaceInfo
+from Components.Converter.COCTimelineInfo import COCTimelineInfo
+from Components.Sources.COCTimeline import TimelineSample
+from Plugins.SystemPlugins.ComponentsCockpit.TraceRecorder import TRACE_VERSION
+
+
+RUNNING_TEXT_OPTIONS = "movetype=running,direction=top,startdelay=0,steptime=50,wrap=1"
+
+
+def loadTrace(lines):
+	lines = iter(lines)
+	header = json.loads(next(lines))
+	if header.get("trace") != TRACE_VERSION:
+		raise ValueError("unsupported trace version: %s" % header.get("trace"))
+	return header, [json.loads(line) for line in lines if line.strip()]
+
+
+def readTrace(path):
+	with open(path) as f:
+		return loadTrace(f)
+
+
+def createEvent(state):
+	if state is None:
+		return None
+	return Event(state["id"], state["name"], state["short"], state["extended"], state["begin"], state["duration"])
+
+
+def createServiceInfo(state):
+	values = dict((getattr(iServiceInformation, name), value) for name, value in state["values"].items() if hasattr(iServiceInformation, name))
+	strings = dict((getattr(iServiceInformation, name), value) for name, value in state["strings"].items() if hasattr(iServiceInformation, name))
+	return ServiceInfo(values, strings, state["transponder"])
+
+
+class CurrentServiceReplay(FakeSource):
+	def __init__(self):
+		seek = Seek(0, 0)
+		FakeSource.__init__(self, seek=seek, player=Player(seek), service=None, info=None, event=None)
+
+	def applyState(self, state):
+		if "position" in state:
+			self.seek.position = state["position"] or 0
+		if "length" in state:
+			self.seek.length = state["length"] or 0
+		if "info" in state:
+			if state["info"] is None:
+				self.service = self.info = None
+			else:
+				self.info = createServiceInfo(state["info"])
+				self.service = PlayableService(self.info, self.seek)
+			self.player.service = self.service
+		if "event" in state:
+			self.event = self.player.event = createEvent(state["event"])
+
+
+class TimelineReplay(CurrentServiceReplay):
+	def __init__(self):
+		CurrentServiceReplay.__init__(self)
+		self.before = self.record = None
+		self.timeline = TimelineSample(None, None, None, 0)
+
+	def applyState(self, state):
+		CurrentServiceReplay.applyState(self, state)
+		if "before" in state:
+			self.before = state["before"]
+		if "record" in state:
+			self.record = state["record"]
+		self.timeline = TimelineSample(self.seek.position, self.before, self.record, self.seek.length)
+
+
+class ServiceEventReplay(FakeSource):
+	def __init__(self):
+		FakeSource.__init__(self, service=None, info=None, event=None, cover=None)
+		self.static_info = StaticServiceInfo()
+
+	def applyState(self, state):
+		if "service" in state:
+			self.service = state["service"] and eServiceReference(state["service"])
+		if "name" in state:
+			self.static_info.name = state["name"]
+		if "length" in state:
+			self.static_info.length = state["length"]
+		if "event" in state:
+			self.event = self.static_info.event = createEvent(state["event"])
+		self.info = self.service and self.static_info
+
+
+class DiskSpaceReplay(FakeSource):
+	def __init__(self):
+		FakeSource.__init__(self, space="", stale=False, write_rate=None, hours_left=None, used_percent=None)
+
+	def applyState(self, state):
+		self.__dict__.update(state)
+
+
+def attachCurrentService(source):
+	consumers = [connectChain(source, COCServiceInfo(atype)) for atype in ("VideoParams", "VideoInfo", "Provider", "Multi,%T %FR %P %SR")]
+	consumers += [connectChain(source, COCServiceInfo(atype), "boolean") for atype in ("IsCrypted", "IsWidescreen", "HasTelext")]
+	consumers += [connectChain(source, COCServicePosition(atype)) for atype in ("Position", "Remaining,ShowHours")]
+	consumers.append(connectChain(source, COCEventName("Name")))
+	extended = COCEventName("ExtendedDescription")
+	extended.connect(source)
+	consumers.append(createRunningText(extended, RUNNING_TEXT_OPTIONS))
+	return consumers
+
+
+def attachTimeline(source):
+	consumers = attachCurrentService(source)
+	consumers += [connectChain(source, COCTimelineInfo(atype)) for atype in ("BehindLive", "BufferFill")]
+	consumers += [connectChain(source, COCTimelineInfo(atype), "value") for atype in ("BehindLive", "BufferFill")]
+	return consumers
+
+
+def attachServiceEvent(source):
+	consumers = [connectChain(source, COCEventName(atype)) for atype in ("Name", "Description")]
+	full = COCEventName("FullDescription")
+	full.connect(source)
+	consumers.append(createRunningText(full, RUNNING_TEXT_OPTIONS))
+	return consumers
+
+
+def attachDiskSpace(source):
+	return [connectChain(source, COCDiskSpaceInfo(atype)) for atype in ("SpaceInfo", "WriteRate", "TimeLeft", "Used")]
+
+
+# recorded source class: (stand-in source, skin elements attached to it)
+REPLAY_SOURCES = {
+	"COCCurrentService": (CurrentServiceReplay, attachCurrentService),
+	"COCTimeline": (TimelineReplay, attachTimeline),
+	"COCServiceEvent": (ServiceEventReplay, attachServiceEvent),
+	"COCDiskSpace": (DiskSpaceReplay, attachDiskSpace),
+}
+
+
+class TraceReplayer(object):
+	def __init__(self, records):
+		self.records = records
+		self.sources = {}
+		self.consumers = []
+		self.skipped = 0
+
+	def getSource(self, sid):
+		if sid not in self.sources:
+			source = None
+			replay = REPLAY_SOURCES.get(sid.split("#")[0])
+			if replay is not None:
+				source = replay[0]()
+				self.consumers += replay[1](source)
+			self.sources[sid] = source
+		return self.sources[sid]
+
+	def replay(self):
+		notifications = 0
+		for _ms, sid, what, state in self.records:
+			source = self.getSource(sid)
+			if source is None:
+				self.skipped += 1
+				continue
+			if what[0] == Element.CHANGED_SPECIFIC:
+				what = [what[0], getattr(iPlayableService, str(what[1]), what[1])]
+			source.applyState(state)
+			source.notify(tuple(what))
+			notifications += 1
+		return notifications
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="replay ComponentsCockpit source traces")
+	parser.add_argument("traces", nargs="+")
+	parser.add_argument("--loops", type=int, default=5)
+	args = parser.parse_args(argv)
+	for path in args.traces:
+		header, records = readTrace(path)
+		replayer = TraceReplayer(records)
+		timings = []
+		for _i in range(args.loops):
+			start = default_timer()
+			notifications = replayer.replay()
+			timings.append(default_timer() - start)
+		best = min(timings)
+		print("%s: %d records from version %s, %.1f ms per replay, %.1f us per notification, %d skipped" % (
+			path, len(records), header.get("version"), best * 1000, best * 1e6 / max(1, notifications), replayer.skipped // args.loops))
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,35 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# runs every bench_*.py benchmark; see README.md
+
+import os
+import glob
+import importlib
+from benchlib import BENCH_DIR, main
+
+
+for path in sorted(glob.glob(os.path.join(BENCH_DIR, "bench_*.py"))):
+	importlib.import_module(os.path.basename(path)[:-3])
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,46 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from Components.Converter.Converter import Converter
+
+
+class ClockToText(Converter, object):
+	DEFAULT = 0
+	WITH_SECONDS = 1
+	IN_MINUTES = 2
+	DATE = 3
+	FORMAT = 4
+	AS_LENGTH = 5
+	TIMESTAMP = 6
+
+	def __init__(self, atype):
+		Converter.__init__(self, atype)
+		self.fmt_string = ""
+		self.type = {
+			"WithSeconds": self.WITH_SECONDS,
+			"InMinutes": self.IN_MINUTES,
+			"Date": self.DATE,
+			"AsLength": self.AS_LENGTH,
+			"Timestamp": self.TIMESTAMP,
+		}.get(atype, self.DEFAULT)
+		if atype.startswith("Format"):
+			self.type = self.FORMAT
+			self.fmt_string = atype[7:]
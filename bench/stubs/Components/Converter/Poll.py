@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from enigma import eTimer
+
+
+class Poll(object):
+	def __init__(self):
+		self.__poll_timer = eTimer()
+		self.__poll_timer_conn = self.__poll_timer.timeout.connect(self.poll)
+		self.__interval = 1000
+		self.__enabled = False
+
+	def __setInterval(self, interval):
+		self.__interval = interval
+		if self.__enabled:
+			self.__poll_timer.start(self.__interval)
+
+	def __setEnable(self, enabled):
+		self.__enabled = enabled
+		if enabled:
+			self.__poll_timer.start(self.__interval)
+		else:
+			self.__poll_timer.stop()
+
+	poll_interval = property(lambda self: self.__interval, __setInterval)
+	poll_enabled = property(lambda self: self.__enabled, __setEnable)
+
+	def poll(self):
+		self.changed((self.CHANGED_POLL,))
+
+	def doSuspend(self, suspended):
+		if self.__enabled:
+			if suspended:
+				self.__poll_timer.stop()
+			else:
+				self.poll()
+				self.poll_enabled = True
+
+	def destroy(self):
+		self.__poll_timer_conn = None
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from enigma import iPlayableService
+from Components.Converter.Converter import Converter
+from Components.Converter.Poll import Poll
+from Components.Element import cached
+
+
+class ServicePosition(Poll, Converter, object):
+	TYPE_LENGTH = 0
+	TYPE_POSITION = 1
+	TYPE_REMAINING = 2
+	TYPE_GAUGE = 3
+	TYPE_ENDTIME = 4
+
+	def __init__(self, atype):
+		args = atype.split(',')
+		atype = args.pop(0)
+		self.negate = "Negate" in args
+		self.detailed = "Detailed" in args
+		self.showHours = "ShowHours" in args
+		self.showNoSeconds = "ShowNoSeconds" in args
+		self.type = {
+			"Length": self.TYPE_LENGTH,
+			"Position": self.TYPE_POSITION,
+			"Remaining": self.TYPE_REMAINING,
+			"Gauge": self.TYPE_GAUGE,
+			"EndTime": self.TYPE_ENDTIME,
+		}[atype]
+		Poll.__init__(self)
+		Converter.__init__(self, atype)
+		self.poll_interval = 500 if self.detailed else 1000
+		self.poll_enabled = True
+
+	def getSeek(self):
+		service = self.source.service
+		return service and service.seek()
+
+	@cached
+	def getPosition(self):
+		seek = self.getSeek()
+		if seek is None:
+			return None
+		pos = seek.getPlayPosition()
+		if pos[0]:
+			return 0
+		return pos[1]
+
+	@cached
+	def getLength(self):
+		seek = self.getSeek()
+		if seek is None:
+			return None
+		length = seek.getLength()
+		if length[0]:
+			return 0
+		return length[1]
+
+	@cached
+	def getCutlist(self):
+		service = self.source.service
+		cue = service and service.cueSheet()
+		return cue and cue.getCutList()
+
+	cutlist = property(getCutlist)
+	position = property(getPosition)
+	length = property(getLength)
+
+	def changed(self, what):
+		cutlist_refresh = what[0] != self.CHANGED_SPECIFIC or what[1] == iPlayableService.evCuesheetChanged
+		time_refresh = what[0] == self.CHANGED_POLL or what[0] == self.CHANGED_SPECIFIC and what[1] == iPlayableService.evCuesheetChanged
+		if cutlist_refresh and self.type == self.TYPE_GAUGE:
+			self.downstream_elements.cutlist_changed()
+		if time_refresh:
+			Converter.changed(self, what)
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# stand-in for enigma2's Components.Element with the same caching and notification flow
+
+
+class ElementError(Exception):
+	def __init__(self, message):
+		Exception.__init__(self, message)
+		self.msg = message
+
+
+class CList(list):
+	# calls a method on every element of the list
+	def __getattr__(self, attr):
+		def call(*args, **kwargs):
+			for element in self:
+				getattr(element, attr)(*args, **kwargs)
+		return call
+
+
+def cached(f):
+	name = f.__name__
+
+	def wrapper(self):
+		cache = self.cache
+		if cache is None:
+			return f(self)
+		if name not in cache:
+			cache[name] = (True, f(self))
+		return cache[name][1]
+	return wrapper
+
+
+class Element(object):
+	CHANGED_DEFAULT = 0
+	CHANGED_ALL = 1
+	CHANGED_CLEAR = 2
+	CHANGED_SPECIFIC = 3
+	CHANGED_POLL = 4
+
+	SINGLE_SOURCE = True
+
+	def __init__(self):
+		self.downstream_elements = CList()
+		self.master = None
+		self.sources = []
+		self.source = None
+		self.__suspended = True
+		self.cache = None
+
+	def connectDownstream(self, downstream):
+		self.downstream_elements.append(downstream)
+		if self.master is None:
+			self.master = downstream
+
+	def connectUpstream(self, upstream):
+		assert not self.SINGLE_SOURCE or self.source is None
+		self.sources.append(upstream)
+		self.source = upstream
+		self.changed((self.CHANGED_DEFAULT,))
+
+	def connect(self, upstream):
+		self.connectUpstream(upstream)
+		upstream.connectDownstream(self)
+
+	def disconnectAll(self):
+		if self.master is not None:
+			self.master.disconnectAll()
+		for source in self.sources:
+			source.disconnectDownstream(self)
+		self.sources = []
+		self.master = None
+
+	def disconnectDownstream(self, downstream):
+		self.downstream_elements.remove(downstream)
+		if self.master == downstream:
+			self.master = None
+		if not self.downstream_elements:
+			self.disconnectAll()
+
+	def changed(self, *args, **kwargs):
+		self.cache = {}
+		self.downstream_elements.changed(*args, **kwargs)
+		self.cache = None
+
+	def setSuspend(self, suspended):
+		changed = self.__suspended != suspended
+		if not self.__suspended and suspended:
+			self.doSuspend(1)
+		elif self.__suspended and not suspended:
+			self.doSuspend(0)
+		self.__suspended = suspended
+		if changed:
+			for source in self.sources:
+				source.checkSuspend()
+
+	suspended = property(lambda self: self.__suspended, setSuspend)
+
+	def checkSuspend(self):
+		self.suspended = self.downstream_elements and all(d.suspended for d in self.downstream_elements)
+
+	def doSuspend(self, suspended):
+		pass
+
+	def destroy(self):
+		pass
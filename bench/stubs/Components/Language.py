@@ -0,0 +1,46 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# stand-in for enigma2's Components.Language, which also installs _() as a builtin
+
+import gettext
+
+gettext.install("enigma2")
+
+
+class Language(object):
+	def __init__(self):
+		self.lang = "de_DE"
+		self.callbacks = []
+
+	def getLanguage(self):
+		return self.lang
+
+	def activateLanguage(self, lang):
+		self.lang = lang
+		for callback in self.callbacks:
+			callback()
+
+	def addCallback(self, callback):
+		self.callbacks.append(callback)
+
+
+language = Language()
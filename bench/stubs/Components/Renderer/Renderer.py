@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from enigma import ePoint, eSize
+from Components.Element import Element
+
+
+class Renderer(Element):
+	GUI_WIDGET = None
+
+	def __init__(self):
+		Element.__init__(self)
+		self.instance = None
+		self.skinAttributes = None
+
+	def GUIcreate(self, parent):
+		self.instance = self.GUI_WIDGET(parent)
+		self.postWidgetCreate(self.instance)
+
+	def GUIdelete(self):
+		self.preWidgetRemove(self.instance)
+		self.instance = None
+
+	def postWidgetCreate(self, instance):
+		pass
+
+	def preWidgetRemove(self, instance):
+		pass
+
+	def applySkin(self, desktop, parent):
+		# only the geometry attributes are applied to the stand-in widget
+		for (attrib, value) in self.skinAttributes or []:
+			if attrib == "position":
+				self.instance.move(ePoint(*(int(x) for x in value.split(","))))
+			elif attrib == "size":
+				self.instance.resize(eSize(*(int(x) for x in value.split(","))))
+		return True
+
+	def onShow(self):
+		self.suspended = False
+
+	def onHide(self):
+		self.suspended = True
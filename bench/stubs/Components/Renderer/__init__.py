@@ -0,0 +1,25 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import os
+
+# the COC components install next to the stock ones, so extend the stand-in package with them
+__path__.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "Components", os.path.basename(os.path.dirname(__file__)))))  # noqa: F821, pylint: disable=E0602
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# stand-in for enigma2's Components.config; values live in memory only
+
+
+class ConfigElement(object):
+	def __init__(self, default=None):
+		self.default = default
+		self._value = default
+		self.notifiers = []
+
+	def getValue(self):
+		return self._value
+
+	def setValue(self, value):
+		self._value = value
+		for notifier in self.notifiers:
+			notifier(self)
+
+	value = property(getValue, setValue)
+
+	def addNotifier(self, notifier, initial_call=True, immediate_feedback=True):
+		self.notifiers.append(notifier)
+		if initial_call:
+			notifier(self)
+
+	def removeNotifier(self, notifier):
+		self.notifiers.remove(notifier)
+
+	def save(self):
+		pass
+
+
+class ConfigSelection(ConfigElement):
+	def __init__(self, choices, default=None):
+		choices = list(choices)
+		ConfigElement.__init__(self, default if default is not None else choices[0])
+		self.choices = choices
+
+
+class ConfigYesNo(ConfigElement):
+	def __init__(self, default=False):
+		ConfigElement.__init__(self, default)
+
+
+class ConfigInteger(ConfigElement):
+	def __init__(self, default=0, limits=None):
+		ConfigElement.__init__(self, default)
+
+
+class ConfigText(ConfigElement):
+	def __init__(self, default="", fixed_size=True):
+		ConfigElement.__init__(self, default)
+
+
+class ConfigDirectory(ConfigText):
+	def __init__(self, default="", visible_width=60):
+		ConfigText.__init__(self, default)
+
+
+class ConfigSubsection(object):
+	pass
+
+
+config = ConfigSubsection()
+config.plugins = ConfigSubsection()
+config.osd = ConfigSubsection()
+config.osd.language = ConfigText(default="de_DE")
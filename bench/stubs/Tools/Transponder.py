@@ -0,0 +1,33 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# stand-in for enigma2's Tools.Transponder, converting the fields the COC converters ask for
+
+
+def ConvertToHumanReadable(tp, tunertype=None):
+	ret = dict(tp)
+	tuner_type = tp.get("tuner_type")
+	ret["tuner_type"] = {1: "Satellite", 2: "Cable", 4: "Terrestrial", 8: "Satellite", 16: "Terrestrial"}.get(tuner_type, "Unknown")
+	ret["modulation"] = {0: "Auto", 1: "QPSK", 2: "8PSK", 3: "QAM16"}.get(tp.get("modulation"), "Auto")
+	ret["polarization"] = {0: "Horizontal", 1: "Vertical", 2: "Circular left", 3: "Circular right"}.get(tp.get("polarization"), "Horizontal")
+	ret["system"] = {0: "DVB-S", 1: "DVB-S2"}.get(tp.get("system"), "DVB-S")
+	ret["orbital_position"] = "%.1f" % (tp.get("orbital_position", 0) / 10.0)
+	return ret
@@ -0,0 +1,318 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# stand-ins for the enigma C++ bindings used by the COC components;
+# they only keep enough state for the Python side to run headless
+
+
+class Signal(list):
+	def connect(self, func):
+		self.append(func)
+		return func
+
+	def __call__(self, *args):
+		for func in self:
+			func(*args)
+
+
+class eTimer(object):
+	# never fires on its own; benchmarks call timeout() to step a timer
+	def __init__(self):
+		self.timeout = Signal()
+		self.interval = 0
+		self.single_shot = False
+		self.active = False
+
+	def start(self, interval, single_shot=False):
+		self.interval = interval
+		self.single_shot = single_shot
+		self.active = True
+
+	def stop(self):
+		self.active = False
+
+	def isActive(self):
+		return self.active
+
+
+class eSocketNotifier(object):
+	Read = 1
+	Write = 4
+
+	def __init__(self, fd, what):
+		self.activated = Signal()
+
+
+class ePoint(object):
+	def __init__(self, x=0, y=0):
+		if isinstance(x, tuple):
+			x, y = x
+		self.px = x
+		self.py = y
+
+	def x(self):
+		return self.px
+
+	def y(self):
+		return self.py
+
+
+class eSize(object):
+	def __init__(self, w=0, h=0):
+		self.w = w
+		self.h = h
+
+	def width(self):
+		return self.w
+
+	def height(self):
+		return self.h
+
+
+class gFont(object):
+	def __init__(self, family, pointSize):
+		self.family = family
+		self.pointSize = pointSize
+
+
+class fontRenderClass(object):
+	instance = None
+
+	@classmethod
+	def getInstance(cls):
+		if cls.instance is None:
+			cls.instance = cls()
+		return cls.instance
+
+	def getLineHeight(self, font):
+		return font.pointSize + font.pointSize // 6
+
+
+class eWidget(object):
+	def __init__(self, parent=None):
+		self.parent = parent
+		self.position = ePoint()
+		self.size = eSize()
+
+	def move(self, pos):
+		self.position = pos
+
+	def resize(self, size):
+		self.size = size
+
+	def show(self):
+		pass
+
+	def hide(self):
+		pass
+
+	def setTransparent(self, transparent):
+		pass
+
+	def setBackgroundColor(self, color):
+		pass
+
+
+class eLabel(eWidget):
+	alignLeft = alignTop = 0
+	alignRight = alignBottom = 1
+	alignCenter = 2
+	alignBlock = 3
+
+	def __init__(self, parent=None):
+		eWidget.__init__(self, parent)
+		self.text = ""
+		self.font = gFont("Regular", 20)
+		self.nowrap = 0
+
+	def setText(self, text):
+		self.text = text
+
+	def setFont(self, font):
+		self.font = font
+
+	def setNoWrap(self, nowrap):
+		self.nowrap = nowrap
+
+	def setVAlign(self, align):
+		pass
+
+	def setHAlign(self, align):
+		pass
+
+	def setForegroundColor(self, color):
+		pass
+
+	def setShadowColor(self, color):
+		pass
+
+	def setShadowOffset(self, offset):
+		pass
+
+	def calculateSize(self):
+		# fixed pitch glyphs of half the point size, wrapped at the label width
+		char_width = max(1, self.font.pointSize // 2)
+		line_height = fontRenderClass.getInstance().getLineHeight(self.font)
+		lines = self.text.split("\n")
+		if self.nowrap or not self.size.w:
+			return eSize(max(len(line) for line in lines) * char_width, len(lines) * line_height)
+		per_line = max(1, self.size.w // char_width)
+		rows = sum(max(1, -(-len(line) // per_line)) for line in lines)
+		return eSize(min(self.size.w, max(len(line) for line in lines) * char_width), rows * line_height)
+
+
+class ePixmap(eWidget):
+	def setPixmap(self, pixmap):
+		pass
+
+	def setScale(self, scale):
+		pass
+
+
+class gPixmapPtr(object):
+	pass
+
+
+class ePicLoad(object):
+	def __init__(self):
+		self.PictureData = Signal()
+
+	def setPara(self, para):
+		pass
+
+	def startDecode(self, path, async_=True):
+		return 0
+
+	def startDecodeBuffer(self, data, size, async_=True):
+		return 0
+
+	def getData(self):
+		return None
+
+
+class eServiceReference(object):
+	idDVB = 1
+	idFile = 0x1001
+
+	def __init__(self, ref=""):
+		self.ref = ref
+		self.path = ref.split(":", 10)[10] if ref.count(":") >= 10 else ""
+
+	def getPath(self):
+		return self.path
+
+	def toString(self):
+		return self.ref
+
+	def valid(self):
+		return bool(self.ref)
+
+
+class iServiceInformation(object):
+	sIsCrypted = 0
+	sAspect = 1
+	sFrameRate = 2
+	sProgressive = 3
+	sVideoHeight = 4
+	sVideoWidth = 5
+	sVideoType = 6
+	sVideoPID = 7
+	sAudioPID = 8
+	sPCRPID = 9
+	sPMTPID = 10
+	sTXTPID = 11
+	sSID = 12
+	sONID = 13
+	sTSID = 14
+	sNamespace = 15
+	sProvider = 16
+	sDescription = 17
+	sServiceref = 18
+	sTimeCreate = 19
+	sFileSize = 20
+	sCAIDs = 21
+	sTransponderData = 22
+	sTransferBPS = 23
+	sEotf = 24
+
+
+class iPlayableService(object):
+	evStart = 0
+	evEnd = 1
+	evTuneFailed = 2
+	evUpdatedEventInfo = 3
+	evUpdatedInfo = 4
+	evNewProgramInfo = 5
+	evSeekableStatusChanged = 6
+	evEOF = 7
+	evSOF = 8
+	evCuesheetChanged = 9
+	evVideoSizeChanged = 10
+	evVideoFramerateChanged = 11
+	evVideoProgressiveChanged = 12
+	evVideoTypeReady = 13
+	evSubtitleListChanged = 14
+	evUser = 100
+
+
+class iRecordableService(object):
+	evStart = 0
+	evEnd = 1
+	evTunedIn = 2
+	evTuneFailed = 3
+	evRecordRunning = 4
+	evRecordStopped = 5
+	evNewProgramInfo = 6
+	evRecordFailed = 7
+	evRecordWriteError = 8
+
+
+class iAudioType_ENUMS(object):
+	atMPEG = 0
+	atAC3 = 1
+	atDTS = 2
+	atAAC = 3
+	atAACHE = 4
+	atLPCM = 5
+	atDTSHD = 6
+	atDDP = 7
+
+
+class iDVBFrontend(object):
+	feSatellite = 1
+	feCable = 2
+	feTerrestrial = 4
+	feSatellite2 = 8
+	feTerrestrial2 = 16
+
+
+(CT_MPEG2, CT_H264, CT_MPEG1, CT_MPEG4_PART2, CT_VC1, CT_VC1_SIMPLE_MAIN, CT_H265, CT_DIVX311, CT_DIVX4, CT_SPARK,
+	CT_VP6, CT_VP8, CT_VP9, CT_H263, CT_MJPEG, CT_REAL, CT_AVS) = range(17)
+CT_UNKNOWN = -1
+
+RT_HALIGN_LEFT = 0
+RT_HALIGN_RIGHT = 1
+RT_HALIGN_CENTER = 2
+RT_HALIGN_BLOCK = 4
+RT_VALIGN_TOP = 0
+RT_VALIGN_CENTER = 8
+RT_VALIGN_BOTTOM = 16
+RT_WRAP = 32
@@ -0,0 +1,33 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from enigma import gFont
+
+
+def parseColor(value):
+	if value.startswith("#"):
+		return int(value[1:], 16)
+	return 0
+
+
+def parseFont(value, scale=((1, 1), (1, 1))):
+	name, size = value.split(";")
+	return gFont(name, int(size) * scale[0][0] // scale[0][1])
@@ -0,0 +1,146 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+# synthetic traces in the TraceRecorder format for the scenarios that are hard to
+# reproduce by hand: zap storms, EPG updates and fast movie list scrolling
+
+import os
+import sys
+from collections import OrderedDict
+import benchlib  # noqa: F401, pylint: disable=W0611
+from enigma import iDVBFrontend
+from Components.Element import Element
+from fixtures import makeText
+from Plugins.SystemPlugins.ComponentsCockpit.TraceRecorder import TraceWriter
+
+
+VIDEO_MODES = ((720, 576, 25000, 0), (1280, 720, 50000, 1), (1920, 1080, 25000, 0), (3840, 2160, 50000, 1))
+PROVIDERS = ("ARD", "ZDF", "RTL", "ProSieben", "arte", "3sat")
+
+
+class TraceLines(list):
+	write = list.append
+
+
+def infoState(i, video=True):
+	width, height, frame_rate, progressive = VIDEO_MODES[i % len(VIDEO_MODES)] if video else (-1, -1, -1, -1)
+	return {
+		"values": {
+			"sVideoWidth": width, "sVideoHeight": height, "sFrameRate": frame_rate, "sProgressive": progressive,
+			"sAspect": 3, "sVideoType": 1, "sVideoPID": 0x65 + i, "sAudioPID": 0x66 + i, "sPCRPID": 0x65 + i,
+			"sPMTPID": 0x64 + i, "sTXTPID": -1 if i % 3 else 0x68, "sSID": 0x2b66 + i, "sONID": 1, "sTSID": 0x3fb,
+			"sIsCrypted": i % 4 == 3, "sTransferBPS": -1,
+		},
+		"strings": {"sProvider": PROVIDERS[i % len(PROVIDERS)], "sServiceref": "1:0:19:%X:3F3:1:C00000:0:0:0:" % (0x2b66 + i), "sEotf": ""},
+		"transponder": {
+			"tuner_type": iDVBFrontend.feSatellite, "frequency": 10744000 + (i % 40) * 50000, "symbol_rate": 22000000,
+			"polarization": i % 2, "modulation": 2, "system": 1, "orbital_position": 192, "fec_inner": 3,
+		},
+	}
+
+
+def eventState(i, begin, size):
+	return {
+		"id": 1000 + i, "name": "Sendung %d" % i, "short": "Sendung %d\n%s" % (i, makeText(size // 8, i)),
+		"extended": makeText(size, i), "begin": begin, "duration": 2700,
+	}
+
+
+def createWriter():
+	lines = TraceLines()
+	return lines, TraceWriter(lines)
+
+
+def zapStorm(zaps=100):
+	# channel up held down: every zap starts a service, video and EPG data follow
+	lines, writer = createWriter()
+	sid = "COCCurrentService#1"
+	start = writer.start
+	for i in range(zaps):
+		t = start + i * 0.4
+		event = eventState(i, 1700000000, 400 + (i * 97) % 1600)
+		steps = (
+			(0, "evStart", infoState(i, False), None),
+			(0.04, "evUpdatedInfo", infoState(i, False), None),
+			(0.12, "evUpdatedEventInfo", infoState(i, False), event),
+			(0.2, "evVideoSizeChanged", infoState(i), event),
+			(0.22, "evVideoFramerateChanged", infoState(i), event),
+		)
+		for delay, name, info, evt in steps:
+			state = {"position": 0, "length": 0, "info": info, "event": evt}
+			writer.record(sid, [Element.CHANGED_SPECIFIC, name], state, t + delay)
+	return lines
+
+
+def epgUpdates(ticks=300):
+	# a timeshift timeline ticking every second while the EPG resends the same events
+	lines, writer = createWriter()
+	sid = "COCTimeline#1"
+	start = writer.start
+	info = infoState(2)
+	for i in range(ticks):
+		event = eventState(i // 60, 1700000000 + (i // 60) * 2700, 1500)
+		state = {"position": i * 90000, "length": (600 + i) * 90000, "before": 0, "record": (600 + i) * 90000, "info": info, "event": event}
+		writer.record(sid, [Element.CHANGED_POLL], state, start + i)
+		if i % 4 == 0:
+			writer.record(sid, [Element.CHANGED_SPECIFIC, "evUpdatedEventInfo"], state, start + i + 0.5)
+	return lines
+
+
+def movieScrolling(entries=200):
+	# a key held down in the movie list, the disk space source refreshing now and then
+	lines, writer = createWriter()
+	sid = "COCServiceEvent#1"
+	disk_sid = "COCDiskSpace#1"
+	start = writer.start
+	for i in range(entries):
+		state = {
+			"service": "1:0:0:0:0:0:0:0:0:0:/media/hdd/movie/%04d - Sendung %d.ts" % (i, i),
+			"name": "Sendung %d" % i, "length": 1800 + (i * 37) % 5400,
+			"event": eventState(i, 1690000000 + i * 86400, 200 + (i * 211) % 3000),
+		}
+		writer.record(sid, [Element.CHANGED_ALL], state, start + i * 0.06)
+		if i % 25 == 0:
+			free = 812.5 - i * 0.1
+			disk = {"space": "%.1f GB free" % free, "stale": False, "write_rate": 1048576.0 * (i % 7), "hours_left": free / 2.5, "used_percent": 100 - int(free / 20)}
+			writer.record(disk_sid, [Element.CHANGED_ALL], disk, start + i * 0.06)
+	return lines
+
+
+SCENARIOS = OrderedDict((
+	("zap_storm", zapStorm),
+	("epg_updates", epgUpdates),
+	("movie_scrolling", movieScrolling),
+))
+
+
+def main(argv=None):
+	outdir = (argv or sys.argv[1:] or ["."])[0]
+	for name, scenario in SCENARIOS.items():
+		path = os.path.join(outdir, name + ".trace")
+		with open(path, "w") as f:
+			f.writelines(scenario())
+		print(path)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
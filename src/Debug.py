@@ -21,30 +21,145 @@
 
 import sys
 import logging
-from Components.config import config, ConfigSubsection, ConfigDirectory, ConfigSelection  # noqa: F401, pylint: disable=W0611
+from time import time
+from logging.handlers import RotatingFileHandler
+from threading import Thread
+try:
+	from Queue import Queue, Full
+except ImportError:
+	from queue import Queue, Full
+from Components.config import config, ConfigSubsection, ConfigDirectory, ConfigSelection, ConfigYesNo
 from .Version import ID, PLUGIN
 
 
-logger = None
+plugin_logger = None
 streamer = None
 format_string = ID + ": " + "%(levelname)s: %(filename)s: %(funcName)s: %(message)s"
+log_file = "/tmp/" + PLUGIN + ".log"
+LOG_QUEUE_SIZE = 1000
+LOG_FILE_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 2
 log_levels = {"ERROR": logging.ERROR, "INFO": logging.INFO, "DEBUG": logging.DEBUG}
 plugin = PLUGIN.lower()
-exec("config.plugins." + plugin + " = ConfigSubsection()")  # noqa: F401, pylint: disable=W0122
-exec("config.plugins." + plugin + ".debug_log_level = ConfigSelection(default='INFO', choices=log_levels.keys())")  # noqa: F401, pylint: disable=W0122
+setattr(config.plugins, plugin, ConfigSubsection())
+plugin_config = getattr(config.plugins, plugin)
+plugin_config.debug_log_level = ConfigSelection(default="INFO", choices=log_levels.keys())
+plugin_config.debug_log_queue = ConfigYesNo(default=False)
+plugin_config.debug_log_file = ConfigYesNo(default=False)
+plugin_config.profiling = ConfigYesNo(default=False)
+plugin_config.profiling_interval = ConfigSelection(default="300", choices=["0", "60", "300", "900"])
+plugin_config.trace_recording = ConfigYesNo(default=False)
+plugin_config.thumbnail_dir = ConfigDirectory(default="/tmp/cockpit_thumbnails/")
+
+
+class QueueLogHandler(logging.Handler):
+	# hands formatted records to a writer thread, so a stalled console or
+	# slow file never blocks the caller; records are dropped when the queue is full
+	def __init__(self, handlers, maxsize=LOG_QUEUE_SIZE):
+		logging.Handler.__init__(self)
+		self.handlers = handlers
+		self.queue = Queue(maxsize)
+		self.dropped = 0
+		writer = Thread(target=self.write)
+		writer.daemon = True
+		writer.start()
+
+	def emit(self, record):
+		try:
+			msg = self.format(record)
+		except Exception:  # pylint: disable=W0703
+			self.handleError(record)
+			return
+		record = logging.makeLogRecord({"name": record.name, "levelno": record.levelno, "levelname": record.levelname, "created": record.created, "msecs": record.msecs, "msg": msg})
+		try:
+			self.queue.put_nowait(record)
+		except Full:
+			self.dropped += 1
+
+	def write(self):
+		while True:
+			record = self.queue.get()
+			if self.dropped:
+				dropped, self.dropped = self.dropped, 0
+				self.handleAll(logging.makeLogRecord({"name": record.name, "levelno": logging.WARNING, "levelname": "WARNING", "msg": ID + ": %d log messages dropped" % dropped}))
+			self.handleAll(record)
+
+	def handleAll(self, record):
+		for handler in self.handlers:
+			handler.handle(record)
+
+
+class RateLimitedLogger(object):
+	# one instance per call site: logs at most once per interval seconds and/or
+	# once every n calls, the number of suppressed calls is added to the next message
+	def __init__(self, interval=0, every=0):
+		self.interval = interval
+		self.every = every
+		self.calls = 0
+		self.suppressed = 0
+		self.last = 0
+
+	def log(self, level, msg, *args):
+		if not logger.isEnabledFor(level):
+			return
+		self.calls += 1
+		now = time()
+		if (self.every and (self.calls - 1) % self.every) or (self.interval and now - self.last < self.interval):
+			self.suppressed += 1
+			return
+		self.last = now
+		if self.suppressed:
+			msg += " (%d suppressed)" % self.suppressed
+			self.suppressed = 0
+		# report the caller of debug()/info()/error() instead of this method
+		frame = sys._getframe(2)  # pylint: disable=W0212
+		code = frame.f_code
+		logger.handle(logger.makeRecord(logger.name, level, code.co_filename, frame.f_lineno, msg, args, None, code.co_name))
+
+	def debug(self, msg, *args):
+		self.log(logging.DEBUG, msg, *args)
+
+	def info(self, msg, *args):
+		self.log(logging.INFO, msg, *args)
+
+	def error(self, msg, *args):
+		self.log(logging.ERROR, msg, *args)
+
+
+class LazyLogger(object):
+	# stands in for the plugin logger, which is set up on first use; resolved
+	# methods are kept and called from the caller's frame, so records name the caller
+	def __getattr__(self, name):
+		value = getattr(initLogging(), name)
+		if callable(value):
+			setattr(self, name, value)
+		return value
+
+
+logger = LazyLogger()
 
 
 def initLogging():
-	global logger
+	global plugin_logger
 	global streamer
-	if not logger:
-		logger = logging.getLogger(ID)
+	if plugin_logger is None:
+		plugin_logger = logging.getLogger(ID)
 		formatter = logging.Formatter(format_string)
 		streamer = logging.StreamHandler(sys.stdout)
 		streamer.setFormatter(formatter)
-		logger.addHandler(streamer)
-		logger.propagate = False
-		setLogLevel(log_levels[eval("config.plugins." + plugin + ".debug_log_level").value])
+		if plugin_config.debug_log_queue.value or plugin_config.debug_log_file.value:
+			streamer.setFormatter(logging.Formatter("%(message)s"))
+			handlers = [streamer]
+			if plugin_config.debug_log_file.value:
+				file_handler = RotatingFileHandler(log_file, maxBytes=LOG_FILE_BYTES, backupCount=LOG_FILE_BACKUPS)
+				file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+				handlers.append(file_handler)
+			streamer = QueueLogHandler(handlers)
+			streamer.setFormatter(formatter)
+		plugin_logger.addHandler(streamer)
+		plugin_logger.propagate = False
+		setLogLevel(log_levels[plugin_config.debug_log_level.value])
+	return plugin_logger
 
 
 def setLogLevel(level):
@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import os
+import ctypes
+import ctypes.util
+from select import POLLIN
+from enigma import eSocketNotifier
+from .Debug import logger
+
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+
+
+class DirectoryWatcher(object):
+	# calls callback() whenever a file is written, created, deleted or moved
+	# in one of the watched directories; does nothing where inotify is missing
+	def __init__(self, callback, mask=IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE):
+		self.callback = callback
+		self.mask = mask
+		self.fd = -1
+		self.notifier = None
+		self.notifier_conn = None
+		self.watched = set()
+		try:
+			self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+			self.fd = self.libc.inotify_init1(IN_NONBLOCK)
+		except (OSError, AttributeError) as e:
+			logger.info("inotify not available: %s", e)
+		if self.fd >= 0:
+			self.notifier = eSocketNotifier(self.fd, POLLIN)
+			self.notifier_conn = self.notifier.activated.connect(self.gotEvents)
+
+	def addDirectory(self, path):
+		if self.fd >= 0 and path not in self.watched:
+			cpath = path if isinstance(path, bytes) else path.encode("utf-8")
+			if self.libc.inotify_add_watch(self.fd, cpath, self.mask) >= 0:
+				self.watched.add(path)
+			else:
+				logger.info("cannot watch: %s", path)
+
+	def gotEvents(self, _what):
+		try:
+			while os.read(self.fd, 4096):
+				pass
+		except OSError:
+			pass
+		self.callback()
+
+	def close(self):
+		self.notifier_conn = None
+		self.notifier = None
+		if self.fd >= 0:
+			os.close(self.fd)
+			self.fd = -1
@@ -0,0 +1,205 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import os
+import re
+from time import time
+from collections import deque
+from twisted.internet import reactor
+from twisted.internet.threads import deferToThread
+from enigma import iRecordableService
+import NavigationInstance
+from .Debug import logger
+from .DirectoryWatcher import DirectoryWatcher
+
+
+BASE_TTL = 5  # seconds a queried value is valid
+MAX_TTL = 60  # ttl limit while values do not change
+REFRESH_TIMEOUT = 10  # seconds until a pending refresh marks the value stale
+TREND_SAMPLES = 32  # (time, free bytes) samples kept per mount
+MOUNTS_FILE = "/proc/mounts"
+
+
+class DiskSpaceEntry(object):
+	# disk space of one mount, shared by all sources showing it
+	def __init__(self, key):
+		self.key = key
+		self.paths = []
+		self.value = ""
+		self.free = None  # bytes available to the recordings, without the blocks reserved for root
+		self.total = None
+		self.used = None
+		self.samples = deque(maxlen=TREND_SAMPLES)
+		self.stale = True
+		self.ttl = BASE_TTL
+		self.expires = 0
+		self.refreshing = False
+		self.refresh_start = 0
+		self.callbacks = []
+
+	def refresh(self, query):
+		# the query runs in a worker thread as it may block on a sleeping
+		# disk or a hung network share; it is not kept to not hold the screen
+		now = time()
+		if self.refreshing:
+			if now - self.refresh_start > REFRESH_TIMEOUT and not self.stale:
+				logger.info("key: %s, refresh timed out", self.key)
+				self.stale = True
+				# refresh is called from within the sources' changed, notify once that has returned
+				reactor.callLater(0, self.notify)
+		elif now >= self.expires:
+			self.refreshing = True
+			self.refresh_start = now
+			deferToThread(self.sample, query, self.paths[:]).addCallbacks(self.gotValue, self.gotError)
+
+	def sample(self, query, paths):
+		# worker thread: formatted value of the player and free/total/used bytes of the first bookmark,
+		# the bookmarks are watched from here as adding a watch blocks on a hung share as well
+		free = total = used = None
+		if paths:
+			stat = os.statvfs(paths[0])
+			free = stat.f_bavail * stat.f_frsize
+			total = stat.f_blocks * stat.f_frsize
+			used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+			for path in paths:
+				watcher.addDirectory(path)
+		return query(), free, total, used
+
+	def invalidate(self):
+		self.expires = 0
+		self.ttl = BASE_TTL
+
+	def gotValue(self, result):
+		value, free, total, used = result
+		self.refreshing = False
+		if free is not None:
+			self.free = free
+			self.total = total
+			self.used = used
+			self.samples.append((time(), free))
+		changed = value != self.value or self.stale
+		if changed:
+			self.ttl = BASE_TTL
+		else:
+			# back off while the value is stable
+			self.ttl = min(self.ttl * 2, MAX_TTL)
+		self.expires = time() + self.ttl
+		self.value = value
+		self.stale = False
+		if changed:
+			self.notify()
+
+	def gotError(self, failure):
+		self.refreshing = False
+		self.ttl = BASE_TTL
+		self.expires = time() + self.ttl
+		self.stale = True
+		logger.error("key: %s, failure: %s", self.key, failure.getErrorMessage())
+		self.notify()
+
+	def getWriteRate(self):
+		# bytes per second written to the mount over the sampled period
+		if len(self.samples) < 2:
+			return None
+		(t0, free0), (t1, free1) = self.samples[0], self.samples[-1]
+		if t1 <= t0:
+			return None
+		return max(0, (free0 - free1) / float(t1 - t0))
+
+	def getHoursLeft(self):
+		# recording hours left at the current write rate
+		rate = self.getWriteRate()
+		if not rate or self.free is None:
+			return None
+		return self.free / rate / 3600
+
+	def getUsedPercent(self):
+		if not self.total:
+			return None
+		return self.used * 100 // self.total
+
+	def notify(self):
+		for callback in self.callbacks[:]:
+			callback()
+
+
+entries = {}
+watcher = None
+
+
+def readMountPoints():
+	# the kernel answers /proc/mounts without touching the mounted file systems
+	mount_points = []
+	try:
+		with open(MOUNTS_FILE) as f:
+			for line in f:
+				fields = line.split()
+				if len(fields) > 1:
+					# blanks and other special characters are octal escaped
+					mount_points.append(re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), fields[1]))
+	except IOError as e:
+		logger.error("exception: %s", e)
+	return mount_points
+
+
+def getMountPoint(path, mount_points):
+	# longest mount point the path is on, None when the mounts are unknown
+	path = os.path.normpath(path)
+	mount_point = None
+	for point in mount_points:
+		if (path == point or path.startswith(point.rstrip("/") + "/")) and (mount_point is None or len(point) > len(mount_point)):
+			mount_point = point
+	return mount_point
+
+
+def getMountKey(paths):
+	# built from the path names only, so a hung network share cannot block the screen opening
+	mount_points = readMountPoints()
+	return tuple(sorted(set(getMountPoint(path, mount_points) or path for path in paths)))
+
+
+def getDiskSpaceEntry(key, paths=None):
+	entry = entries.get(key)
+	if entry is None:
+		initInvalidation()
+		entry = entries[key] = DiskSpaceEntry(key)
+	for path in paths or []:
+		if path not in entry.paths:
+			entry.paths.append(path)
+	return entry
+
+
+def invalidateDiskSpace():
+	for entry in entries.values():
+		entry.invalidate()
+
+
+def gotRecordEvent(_service, event):
+	if event in (iRecordableService.evStart, iRecordableService.evEnd):
+		invalidateDiskSpace()
+
+
+def initInvalidation():
+	global watcher
+	if watcher is None:
+		watcher = DirectoryWatcher(invalidateDiskSpace)
+		if NavigationInstance.instance is not None:
+			NavigationInstance.instance.record_event.append(gotRecordEvent)
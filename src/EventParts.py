@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from .LRUCache import LRUCache
+from .TextUtils import normalizeText
+
+
+EVENT_PARTS_CACHE_SIZE = 32
+event_parts = LRUCache(EVENT_PARTS_CACHE_SIZE)
+
+
+def filterText(text):
+	return normalizeText(text).lstrip(" \n")
+
+
+# raw and filtered texts of one event, fetched once and shared by all converters
+class EventParts(object):
+	def __init__(self, event):
+		self.event = event
+		self.__raw_name = None
+		self.__name = None
+		self.__short = None
+		self.__extended = None
+		self.__short_descs = {}
+		self.__extended_descs = {}
+
+	@property
+	def raw_name(self):
+		if self.__raw_name is None:
+			self.__raw_name = self.event.getEventName()
+		return self.__raw_name
+
+	@property
+	def name(self):
+		if self.__name is None:
+			self.__name = filterText(self.raw_name)
+		return self.__name
+
+	@property
+	def short(self):
+		if self.__short is None:
+			self.__short = filterText(self.event.getShortDescription())
+		return self.__short
+
+	@property
+	def extended(self):
+		if self.__extended is None:
+			self.__extended = filterText(self.event.getExtendedDescription())
+		return self.__extended
+
+	def getShortDesc(self, keep_title, single, no_newline):
+		key = (keep_title, single, no_newline)
+		desc = self.__short_descs.get(key)
+		if desc is None:
+			desc_list = self.short.split("\n")
+
+			# remove eventname if first entry in ShortDesc
+			if not keep_title and desc_list[0] == self.name:
+				desc_list.pop(0)
+
+			# return only 1 values/lines from ShortDesc
+			if single:
+				desc_list = desc_list[:1]
+
+			if no_newline:
+				desc = ", ".join(desc_list).strip()
+			else:
+				desc = "\n".join(desc_list).strip()
+			self.__short_descs[key] = desc
+		return desc
+
+	def getExtendedDesc(self, no_double_newline):
+		desc = self.__extended_descs.get(no_double_newline)
+		if desc is None:
+			desc = self.extended
+			if desc and no_double_newline:
+				desc = desc.replace("\n\n", "\n")
+			self.__extended_descs[no_double_newline] = desc
+		return desc
+
+
+def getEventFingerprint(event):
+	if event is None:
+		return None
+	return (event.getEventId(), event.getBeginTime(), event.getDuration())
+
+
+def getEventParts(event):
+	key = (event.getEventId(), event.getBeginTime())
+	parts = event_parts.get(key)
+	if parts is None:
+		parts = EventParts(event)
+		event_parts.put(key, parts)
+	return parts
@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from threading import Lock
+from collections import OrderedDict
+
+
+class LRUCache(object):
+	def __init__(self, maxsize, maxbytes=0):
+		self.maxsize = maxsize
+		# optional memory budget, entries are put with their size in bytes
+		self.maxbytes = maxbytes
+		self.nbytes = 0
+		self.sizes = {}
+		self.hits = self.misses = 0
+		self.entries = OrderedDict()
+		# entries may be filled from prefetch worker threads
+		self.lock = Lock()
+
+	def __len__(self):
+		return len(self.entries)
+
+	def __contains__(self, key):
+		return key in self.entries
+
+	def get(self, key, default=None):
+		with self.lock:
+			try:
+				value = self.entries.pop(key)
+			except KeyError:
+				self.misses += 1
+				return default
+			self.hits += 1
+			self.entries[key] = value
+			return value
+
+	def put(self, key, value, nbytes=0):
+		with self.lock:
+			self.__remove(key)
+			self.entries[key] = value
+			if nbytes:
+				self.sizes[key] = nbytes
+				self.nbytes += nbytes
+			while len(self.entries) > self.maxsize or (self.maxbytes and self.nbytes > self.maxbytes and len(self.entries) > 1):
+				self.__remove(next(iter(self.entries)))
+
+	def __remove(self, key):
+		self.entries.pop(key, None)
+		self.nbytes -= self.sizes.pop(key, 0)
+
+	def remove(self, key):
+		with self.lock:
+			self.__remove(key)
+
+	def clear(self):
+		with self.lock:
+			self.entries.clear()
+			self.sizes.clear()
+			self.nbytes = 0
+
+	def getStats(self):
+		return {"entries": len(self.entries), "bytes": self.nbytes, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import os
+from collections import namedtuple
+from enigma import iServiceInformation
+from ServiceReference import ServiceReference
+from .LRUCache import LRUCache
+from .DirectoryWatcher import DirectoryWatcher
+
+
+MOVIE_INFO_CACHE_SIZE = 500
+MOVIE_COVER_CACHE_SIZE = 24
+MovieMeta = namedtuple("MovieMeta", "description short_description service_name file_size duration")
+movie_info_cache = LRUCache(MOVIE_INFO_CACHE_SIZE)
+movie_cover_cache = LRUCache(MOVIE_COVER_CACHE_SIZE)
+cover_watcher = None
+
+
+def getFileStamp(path):
+	try:
+		stat = os.stat(path)
+		return stat.st_mtime, stat.st_size
+	except OSError:
+		return None
+
+
+def getMovieMeta(service, info, getEvent):
+	# getEvent is only called when the entry of the recording has to be (re)built
+	path = service.getPath()
+	stamp = getFileStamp(path)
+	entry = movie_info_cache.get(path)
+	if entry is not None and stamp is not None and entry[0] == stamp:
+		return entry[1]
+
+	event = getEvent()
+	description = info.getInfoString(service, iServiceInformation.sDescription)
+	short_description = ""
+	duration = None
+	if event:
+		short_description = description or event.getShortDescription()
+		duration = event.getDuration()
+	service_name = ServiceReference(info.getInfoString(service, iServiceInformation.sServiceref)).getServiceName()
+	file_size = info.getInfoObject(service, iServiceInformation.sFileSize)
+	meta = MovieMeta(description, short_description, service_name, file_size, duration)
+	if stamp is not None:
+		movie_info_cache.put(path, (stamp, meta))
+	return meta
+
+
+def getMovieCover(service, info):
+	# covers are kept against the stamp of the recording and dropped when a file in its
+	# directory is written, so a cover downloaded or replaced later is read again;
+	# recordings without a cover are not cached for the same reason
+	path = service.getPath()
+	stamp = getFileStamp(path)
+	entry = movie_cover_cache.get(path)
+	if entry is not None and stamp is not None and entry[0] == stamp:
+		return entry[1]
+	cover = info.getCover()
+	if cover and stamp is not None:
+		movie_cover_cache.put(path, (stamp, cover))
+		if cover_watcher is not None:
+			cover_watcher.addDirectory(os.path.dirname(path))
+	return cover
+
+
+def initCoverInvalidation():
+	# the watcher hooks into the main loop, so it is created from the main thread
+	global cover_watcher
+	if cover_watcher is None:
+		cover_watcher = DirectoryWatcher(movie_cover_cache.clear)
+
+
+def invalidateMovieMeta(path):
+	movie_info_cache.remove(path)
+	movie_cover_cache.remove(path)
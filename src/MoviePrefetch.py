@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from threading import Thread, Condition
+from collections import deque
+from .Debug import logger
+from .MovieInfoCache import getMovieMeta, getMovieCover
+
+
+PREFETCH_COUNT = 8
+PREFETCH_WORKERS = 2
+PREFETCH_QUEUE_SIZE = 16
+
+
+class MoviePrefetcher(object):
+	# warms the movie info and cover caches for the list items the cursor
+	# is moving to; a new prefetch() cancels all jobs that did not start yet
+	def __init__(self, servicecenter, workers=PREFETCH_WORKERS, queue_size=PREFETCH_QUEUE_SIZE):
+		self.servicecenter = servicecenter
+		self.workers = workers
+		self.queue = deque(maxlen=queue_size)
+		self.condition = Condition()
+		self.generation = 0
+		self.threads = []
+		self.running = False
+
+	def start(self):
+		with self.condition:
+			if not self.running:
+				self.running = True
+				for _i in range(self.workers):
+					thread = Thread(target=self.work)
+					thread.daemon = True
+					thread.start()
+					self.threads.append(thread)
+
+	def stop(self):
+		with self.condition:
+			self.running = False
+			self.queue.clear()
+			self.condition.notify_all()
+		self.threads = []
+
+	def prefetch(self, services, index, direction=1, count=PREFETCH_COUNT):
+		# direction: 1 when moving down the list, -1 when moving up
+		self.start()
+		with self.condition:
+			self.generation += 1
+			self.queue.clear()
+			for i in range(1, count + 1):
+				pos = index + i * direction
+				if not 0 <= pos < len(services):
+					break
+				self.queue.append((self.generation, services[pos]))
+			self.condition.notify_all()
+
+	def cancel(self):
+		with self.condition:
+			self.generation += 1
+			self.queue.clear()
+
+	def work(self):
+		while True:
+			with self.condition:
+				while self.running and not self.queue:
+					self.condition.wait()
+				if not self.running:
+					return
+				generation, service = self.queue.popleft()
+				if generation != self.generation:
+					continue
+			try:
+				info = self.servicecenter.info(service)
+				if info:
+					getMovieMeta(service, info, lambda: info.getEvent(service))
+					getMovieCover(service, info)
+			except Exception as e:  # pylint: disable=W0703
+				logger.error("service: %s, exception: %s", service.toString(), e)
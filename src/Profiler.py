@@ -0,0 +1,156 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from time import time
+from enigma import eTimer
+from Components.Sources.Source import Source
+from Components.Renderer.Renderer import Renderer
+from .Debug import logger, plugin_config
+
+
+PROFILED_METHODS = ("changed", "movingLoop")
+PROFILED_PROPERTIES = (("text", "getText"), ("boolean", "getBoolean"), ("value", "getValue"))
+# (component, skin argument, method) -> [calls, total time, max time, delivered, suppressed],
+# delivered and suppressed count notifications of sources and converters only
+profile_stats = {}
+report_timer = None
+report_timer_conn = None
+
+
+def isProfilingEnabled():
+	return plugin_config.profiling.value
+
+
+def getStats(self, name):
+	key = (self.__class__.__name__, getattr(self, "converter_arguments", ""), name)
+	stats = profile_stats.get(key)
+	if stats is None:
+		stats = profile_stats[key] = [0, 0.0, 0.0, 0, 0]
+	return stats
+
+
+def profileEvaluation(f, name):
+	def wrapper(self):
+		active = self.__dict__.setdefault("profile_active", set())
+		if name in active:
+			return f(self)
+		active.add(name)
+		start = time()
+		try:
+			return f(self)
+		finally:
+			active.discard(name)
+			elapsed = time() - start
+			stats = getStats(self, name)
+			stats[0] += 1
+			stats[1] += elapsed
+			stats[2] = max(stats[2], elapsed)
+			self.profile_evaluated = True
+	wrapper.profiled = True
+	return wrapper
+
+
+def markDelivery(f):
+	# a source delivered its notification when downstream read it through its cache meanwhile
+	def wrapper(self):
+		if self.cache is not None:
+			self.profile_evaluated = True
+		return f(self)
+	wrapper.profiled = True
+	return wrapper
+
+
+def profileMethod(f, name, notification):
+	def wrapper(self, *args, **kwargs):
+		# an override calling its profiled base method is counted once, by the outer call
+		active = self.__dict__.setdefault("profile_active", set())
+		if name in active:
+			return f(self, *args, **kwargs)
+		active.add(name)
+		# a notification is delivered when downstream evaluated this component during it
+		self.profile_evaluated = False
+		start = time()
+		try:
+			return f(self, *args, **kwargs)
+		finally:
+			active.discard(name)
+			elapsed = time() - start
+			stats = getStats(self, name)
+			stats[0] += 1
+			stats[1] += elapsed
+			stats[2] = max(stats[2], elapsed)
+			if notification:
+				if self.profile_evaluated:
+					stats[3] += 1
+				else:
+					stats[4] += 1
+	wrapper.profiled = True
+	return wrapper
+
+
+def profiled(cls):
+	# class decorator for COC components; returns the class untouched while profiling is off
+	if not isProfilingEnabled():
+		return cls
+	for name in PROFILED_METHODS:
+		method = getattr(cls, name, None)
+		if method is not None and not getattr(method, "profiled", False):
+			# renderers are not read by anyone, so their notifications are neither delivered nor suppressed
+			notification = name == "changed" and not issubclass(cls, Renderer)
+			setattr(cls, name, profileMethod(getattr(method, "__func__", method), name, notification))
+	if issubclass(cls, Source):
+		# sources are read through their own properties (event, info, service, space, ...)
+		names = set()
+		for klass in cls.__mro__:
+			if klass is not Source and issubclass(klass, Source):
+				names.update(name for name, value in vars(klass).items() if isinstance(value, property))
+		for name in names:
+			prop = getattr(cls, name)
+			if isinstance(prop, property) and prop.fget is not None and not getattr(prop.fget, "profiled", False):
+				setattr(cls, name, property(markDelivery(prop.fget), prop.fset))
+	else:
+		for name, getter in PROFILED_PROPERTIES:
+			prop = getattr(cls, name, None)
+			if isinstance(prop, property) and not getattr(prop.fget, "profiled", False):
+				setattr(cls, name, property(profileEvaluation(prop.fget, getter)))
+	startReportTimer()
+	return cls
+
+
+def dumpProfile(reset=False):
+	lines = ["component | argument | method | calls | total ms | avg ms | max ms | delivered | suppressed"]
+	for (component, argument, method), (calls, total, maximum, delivered, suppressed) in sorted(profile_stats.items(), key=lambda item: item[1][1], reverse=True):
+		counted = delivered or suppressed
+		lines.append("%s | %s | %s | %d | %.1f | %.3f | %.3f | %s | %s" % (
+			component, argument, method, calls, total * 1000, total * 1000 / calls, maximum * 1000,
+			delivered if counted else "-", suppressed if counted else "-"))
+	logger.info("profile:\n%s", "\n".join(lines))
+	if reset:
+		profile_stats.clear()
+
+
+def startReportTimer():
+	global report_timer, report_timer_conn
+	interval = int(plugin_config.profiling_interval.value)
+	if report_timer is None and interval:
+		report_timer = eTimer()
+		report_timer_conn = report_timer.timeout.connect(dumpProfile)
+		report_timer.start(interval * 1000, False)
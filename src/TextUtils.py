@@ -0,0 +1,123 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import re
+
+
+# line break codes found in EPG and meta texts: DVB CR/LF (0x8A, raw or utf-8
+# encoded), escaped "\n" and CR/CRLF
+LINE_BREAK = "\xc2\x8a|\xe0\x8a|(?<![\x80-\xff])\x8a|\\\\n|\r\n?"
+line_break_re = re.compile(LINE_BREAK)
+flatten_re = re.compile(" *(?:%s|\n)(?:%s|\n| )*" % (LINE_BREAK, LINE_BREAK))
+
+
+def normalizeText(text):
+	# map all line break codes to "\n" in one pass
+	return line_break_re.sub("\n", text)
+
+
+def flattenText(text):
+	# collapse every run of line breaks and the blanks around them to a single space
+	return flatten_re.sub(" ", text)
+
+
+class TextPager(object):
+	# splits a long text into pages of at most max_chars characters and/or
+	# max_lines lines; page boundaries are only searched when a page is requested.
+	# The text may be given as a list of parts, strings or functions returning one,
+	# a part is only fetched when a requested page reaches into it
+	def __init__(self, text, max_chars=0, max_lines=0):
+		self.text = ""
+		self.parts = list(text) if isinstance(text, (list, tuple)) else [text]
+		self.max_chars = max_chars
+		self.max_lines = max_lines
+		self.pages = []  # (start, end) of the pages found so far
+
+	def __fetchPart(self):
+		# appends the next non empty part to the text, False when all parts are fetched
+		while self.parts:
+			part = self.parts.pop(0)
+			if callable(part):
+				part = part()
+			if part:
+				self.text += part
+				return True
+		return False
+
+	def __pageEnd(self, start):
+		end, final = self.__cutPage(start)
+		while not final and self.__fetchPart():
+			end, final = self.__cutPage(start)
+		return end
+
+	def __cutPage(self, start):
+		# end of the page at start in the fetched text, final when more text cannot move it
+		text = self.text
+		end = len(text)
+		final = False
+		if self.max_chars and start + self.max_chars < end:
+			final = True
+			end = start + self.max_chars
+			cut = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+			if cut > start:
+				end = cut + 1
+			elif isinstance(text, bytes):
+				# do not split a utf-8 sequence
+				while end > start + 1 and ord(text[end:end + 1]) & 0xC0 == 0x80:
+					end -= 1
+		if self.max_lines:
+			pos = start
+			for _line in range(self.max_lines):
+				pos = text.find("\n", pos, end)
+				if pos < 0:
+					break
+				pos += 1
+			else:
+				final = True
+				end = pos
+		return end, final
+
+	def __skipBlanks(self, pos):
+		# pages do not start with empty lines or the blanks left after a cut
+		while pos < len(self.text) or self.__fetchPart():
+			if self.text[pos] not in " \n":
+				break
+			pos += 1
+		return pos
+
+	def __page(self, index):
+		# (start, end) of page index, None when the text ends before that page
+		pages = self.pages
+		while len(pages) <= index:
+			start = self.__skipBlanks(pages[-1][1] if pages else 0)
+			if pages and start >= len(self.text):
+				return None
+			pages.append((start, self.__pageEnd(start)))
+		return pages[index]
+
+	def hasPage(self, index):
+		return self.__page(index) is not None
+
+	def getPage(self, index):
+		page = self.__page(index)
+		if page is None:
+			return ""
+		return self.text[page[0]:page[1]].strip(" \n")
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import os
+from io import BytesIO
+from hashlib import md5
+from twisted.internet.threads import deferToThread
+from .Debug import logger, plugin_config
+try:
+	from PIL import Image
+except ImportError:
+	Image = None
+
+
+THUMBNAIL_CACHE_BYTES = 32 * 1024 * 1024
+THUMBNAIL_EXT = ".png"
+requested_thumbnails = set()
+
+
+def getThumbnailDir():
+	return plugin_config.thumbnail_dir.value
+
+
+def getThumbnailPath(checksum, length, size):
+	# thumbnails are keyed by the content of the cover (checksum and length) and the target size,
+	# so a replaced cover gets a new thumbnail
+	key = "%08x:%d:%dx%d" % (checksum, length, size[0], size[1])
+	if not isinstance(key, bytes):
+		key = key.encode("utf-8")
+	return os.path.join(getThumbnailDir(), md5(key).hexdigest() + THUMBNAIL_EXT)
+
+
+def findThumbnail(thumbnail_path):
+	# a hit touches the thumbnail so that the eviction keeps the thumbnails in use
+	try:
+		os.utime(thumbnail_path, None)
+	except OSError:
+		return None
+	return thumbnail_path
+
+
+def removeThumbnail(thumbnail_path):
+	# drop a thumbnail the decoder could not read, it is created anew on the next request
+	try:
+		os.remove(thumbnail_path)
+	except OSError as e:
+		logger.error("path: %s, exception: %s", thumbnail_path, e)
+
+
+def requestThumbnail(thumbnail_path, cover, size):
+	# create the thumbnail in the reactor thread pool, once per path
+	if Image is not None and thumbnail_path not in requested_thumbnails:
+		requested_thumbnails.add(thumbnail_path)
+		deferred = deferToThread(createThumbnail, thumbnail_path, cover, size)
+		deferred.addErrback(thumbnailError, thumbnail_path)
+		deferred.addBoth(lambda _result: requested_thumbnails.discard(thumbnail_path))
+
+
+def thumbnailError(failure, thumbnail_path):
+	logger.error("thumbnail: %s, failure: %s", thumbnail_path, failure.getErrorMessage())
+
+
+def createThumbnail(thumbnail_path, cover, size):
+	# runs in a worker thread: scale the cover to fit size and store it as lightly compressed png
+	image = Image.open(BytesIO(cover))
+	image.thumbnail(size)
+	if image.mode not in ("RGB", "RGBA"):
+		image = image.convert("RGBA")
+	thumbnail_dir = os.path.dirname(thumbnail_path)
+	if not os.path.isdir(thumbnail_dir):
+		os.makedirs(thumbnail_dir)
+	tmp_path = thumbnail_path + ".tmp"
+	image.save(tmp_path, "PNG", compress_level=1)
+	os.rename(tmp_path, thumbnail_path)
+	evictThumbnails(thumbnail_dir)
+
+
+def evictThumbnails(thumbnail_dir, max_bytes=THUMBNAIL_CACHE_BYTES):
+	# remove least recently used thumbnails until the store fits its budget
+	thumbnails = []
+	total = 0
+	for name in os.listdir(thumbnail_dir):
+		if name.endswith(THUMBNAIL_EXT):
+			path = os.path.join(thumbnail_dir, name)
+			try:
+				stat = os.stat(path)
+			except OSError:
+				continue
+			thumbnails.append((stat.st_mtime, stat.st_size, path))
+			total += stat.st_size
+	if total > max_bytes:
+		thumbnails.sort()
+		for _mtime, size, path in thumbnails:
+			try:
+				os.remove(path)
+			except OSError as e:
+				logger.error("path: %s, exception: %s", path, e)
+			total -= size
+			if total <= max_bytes:
+				break
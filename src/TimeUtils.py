@@ -0,0 +1,75 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+from time import localtime
+from Components.Language import language
+from . import _
+
+
+localtime_cache = {}
+LOCALTIME_CACHE_SIZE = 64
+date_names = None
+date_cache = {}
+DATE_FORMATS = {
+	"de_DE": "%(weekday)s, %(day)02d. %(month)s %(year)d",
+}
+DEFAULT_DATE_FORMAT = "%(weekday)s %(month)s %(day)02d, %(year)d"
+
+
+def cachedLocaltime(secs):
+	secs = int(secs)
+	t = localtime_cache.get(secs)
+	if t is None:
+		if len(localtime_cache) >= LOCALTIME_CACHE_SIZE:
+			localtime_cache.clear()
+		t = localtime_cache[secs] = localtime(secs)
+	return t
+
+
+def buildDateNames():
+	return (
+		(_("Monday"), _("Tuesday"), _("Wednesday"), _("Thursday"), _("Friday"), _("Saturday"), _("Sunday")),
+		(_("January"), _("February"), _("March"), _("April"), _("May"), _("June"), _("July"), _("August"), _("September"), _("October"), _("November"), _("December"))
+	)
+
+
+def resetDateNames():
+	global date_names
+	date_names = None
+	date_cache.clear()
+
+
+def formatDate(t, lang):
+	global date_names
+	key = (t.tm_year, t.tm_yday, lang)
+	text = date_cache.get(key)
+	if text is None:
+		if date_names is None:
+			date_names = buildDateNames()
+		weekdays, months = date_names
+		date_cache.clear()
+		text = date_cache[key] = DATE_FORMATS.get(lang, DEFAULT_DATE_FORMAT) % {
+			"weekday": weekdays[t.tm_wday], "day": t.tm_mday, "month": months[t.tm_mon - 1], "year": t.tm_year
+		}
+	return text
+
+
+language.addCallback(resetDateNames)
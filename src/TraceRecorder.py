@@ -0,0 +1,137 @@
+#!/usr/bin/python
+# coding=utf-8
+#
+# Copyright (C) 2018-2025 by dream-alpha
+#
+# In case of reuse of this source code please do not remove this copyright.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For more information on the GNU General Public License see:
+# <http://www.gnu.org/licenses/>.
+
+
+import json
+from time import time
+from enigma import iServiceInformation, iPlayableService
+from .Debug import logger, plugin_config
+from .Version import PLUGIN, VERSION
+
+
+TRACE_VERSION = 1
+trace_file = "/tmp/" + PLUGIN + ".trace"
+# service information recorded by name, so traces stay readable across image versions
+INFO_VALUES = (
+	"sVideoWidth", "sVideoHeight", "sFrameRate", "sProgressive", "sAspect", "sVideoType", "sVideoPID", "sAudioPID",
+	"sPCRPID", "sPMTPID", "sTXTPID", "sSID", "sONID", "sTSID", "sIsCrypted", "sTransferBPS"
+)
+INFO_STRINGS = ("sProvider", "sServiceref", "sEotf")
+# service events recorded by name as well, their numbers differ between images
+PLAYABLE_EVENTS = dict((getattr(iPlayableService, name), name) for name in dir(iPlayableService) if name.startswith("ev"))
+trace_writer = None
+
+
+def isTracingEnabled():
+	return plugin_config.trace_recording.value
+
+
+def getEventState(event):
+	if event is None:
+		return None
+	return {
+		"id": event.getEventId(),
+		"name": event.getEventName(),
+		"short": event.getShortDescription(),
+		"extended": event.getExtendedDescription(),
+		"begin": event.getBeginTime(),
+		"duration": event.getDuration(),
+	}
+
+
+def getInfoState(info):
+	if not info:
+		return None
+	state = {"values": {}, "strings": {}}
+	for name in INFO_VALUES:
+		what = getattr(iServiceInformation, name, None)
+		if what is not None:
+			state["values"][name] = info.getInfo(what)
+	for name in INFO_STRINGS:
+		what = getattr(iServiceInformation, name, None)
+		if what is not None:
+			state["strings"][name] = info.getInfoString(what)
+	state["transponder"] = info.getInfoObject(iServiceInformation.sTransponderData)
+	return state
+
+
+def getJsonValue(value):
+	# raw DVB texts of python 2 are not always valid utf-8, such strings are kept as latin-1
+	if isinstance(value, bytes):
+		try:
+			return value.decode("utf-8")
+		except UnicodeDecodeError:
+			return value.decode("latin-1")
+	if isinstance(value, dict):
+		return dict((getJsonValue(key), getJsonValue(item)) for key, item in value.items())
+	if isinstance(value, (list, tuple)):
+		return [getJsonValue(item) for item in value]
+	return value
+
+
+class TraceWriter(object):
+	# one json list per line: [ms since start, source id, notification, changed state values]
+	def __init__(self, out):
+		self.out = out
+		self.start = time()
+		self.states = {}
+		self.out.write(json.dumps({"trace": TRACE_VERSION, "version": VERSION, "start": int(self.start)}) + "\n")
+
+	def record(self, sid, what, state, now=None):
+		last = self.states.get(sid, {})
+		delta = dict((key, value) for key, value in state.items() if key not in last or last[key] != value)
+		ms = int(((time() if now is None else now) - self.start) * 1000)
+		self.out.write(json.dumps(getJsonValue([ms, sid, what, delta]), separators=(",", ":"), sort_keys=True) + "\n")
+		# only a written record is the base of the next delta
+		self.states[sid] = state
+
+
+def getTraceWriter():
+	global trace_writer
+	if trace_writer is None:
+		# line buffered, so the trace survives a crash of the box
+		trace_writer = TraceWriter(open(trace_file, "w", 1))
+		logger.info("recording trace to %s", trace_file)
+	return trace_writer
+
+
+def recordTrace(source, what):
+	sid = "%s#%x" % (source.__class__.__name__, id(source))
+	what = list(what)
+	if what[0] == source.CHANGED_SPECIFIC:
+		what[1] = PLAYABLE_EVENTS.get(what[1], what[1])
+	try:
+		getTraceWriter().record(sid, what, source.getTraceState())
+	except (TypeError, ValueError, AttributeError, IOError) as e:
+		logger.error("sid: %s, exception: %s", sid, e)
+
+
+def traced(cls):
+	# class decorator for COC sources; records every notification with the state
+	# the converters will query, returns the class untouched while tracing is off
+	if not isTracingEnabled():
+		return cls
+	changed = getattr(cls.changed, "__func__", cls.changed)
+
+	def tracedChanged(self, what, *args, **kwargs):
+		recordTrace(self, what)
+		changed(self, what, *args, **kwargs)
+	cls.changed = tracedChanged
+	return cls
@@ -24,7 +24,9 @@ import gettext
 from Components.Language import language
 from Tools.Directories import resolveFilename, SCOPE_PLUGINS
 from .Version import PLUGIN
-from .Debug import initLogging
+
+
+locale_bound = False
 
 
 def initLocale():
@@ -36,10 +38,18 @@ def initLocale():
 		gettext.bindtextdomain(PLUGIN, locale)
 
 
+def resetLocale():
+	# the locale of the new language is bound with the next translation
+	global locale_bound
+	locale_bound = False
+
+
 def _(txt):
+	global locale_bound
+	if not locale_bound:
+		locale_bound = True
+		initLocale()
 	return gettext.dgettext(PLUGIN, txt)
 
 
-initLogging()
-initLocale()
-language.addCallback(initLocale)
+language.addCallback(resetLocale)